@@ -13,8 +13,8 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QLabel, QVBoxLa
                            QPushButton, QGridLayout, QGroupBox, QFrame, QSplitter, QProgressDialog)
 from PyQt5.QtCore import QTranslator, Qt, QSize, QTimer
 from PyQt5.QtGui import QIcon, QFont, QMovie
-from modules.auth import can_connect_to_hpc, check_and_login_with_key, get_last_node_info, check_network_connectivity, HPC_SERVER
-from ui.login_dialog import LoginDialog, get_last_node_info as ui_get_last_node_info
+from modules.auth import can_connect_to_hpc, check_and_login_with_key, check_network_connectivity, HPC_SERVER
+from ui.login_dialog import LoginDialog
 from ui.task_manager_widget import TaskManagerWidget
 from ui.node_status_widget import NodeStatusWidget
 from ui.balance_widget import BalanceWidget
@@ -171,8 +171,9 @@ class MainWindow(QMainWindow):
     def setup_vscode_page(self):
         """Set up VSCode configuration page"""
         # Create VSCode configuration component
-        vscode_widget = VSCodeWidget(username=self.username)
-        
+        self.vscode_widget = VSCodeWidget(username=self.username)
+        vscode_widget = self.vscode_widget
+
         # Create page container
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -214,7 +215,7 @@ class MainWindow(QMainWindow):
         if login_dialog.exec_():
             # Login successful
             self.username = login_dialog.uc_id_input.text()
-            self.node_info = ui_get_last_node_info()
+            self.node_info = login_dialog.node_info
             self.init_components()
         else:
             # Login cancelled or failed
@@ -241,6 +242,11 @@ class MainWindow(QMainWindow):
                                      QMessageBox.No)
         
         if reply == QMessageBox.Yes:
+            # Abort any in-flight SSH polling so a stalled channel
+            # can't block application exit
+            manager = getattr(self.vscode_widget, 'vscode_manager', None)
+            if manager is not None:
+                manager.shutdown()
             event.accept()
         else:
             event.ignore()
@@ -273,7 +279,7 @@ def main():
         return 0
     
     username = login_dialog.uc_id_input.text()
-    node_info = get_last_node_info()
+    node_info = login_dialog.node_info
     
     # 创建并显示加载提示（使用旋转指示器）
     loading_dialog = QDialog()
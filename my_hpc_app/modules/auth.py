@@ -1,4 +1,6 @@
+import json
 import os
+import re
 import subprocess
 import time
 import logging
@@ -15,35 +17,156 @@ HPC_SERVER = 'hpc3.rcic.uci.edu'
 KEY_PASSPHRASE = "create_key_for_hpc_app"  # Fixed passphrase
 APP_MARKER = "_hpc_app_key"  # Application marker
 
+# Seconds a cached login session stays valid for repeat logins
+SESSION_CACHE_TTL = 120
+
+# Shell-prompt pattern list compiled once; pexpect otherwise re-parses
+# the pattern list on every expect() call
+_PROMPT_PATTERNS = [re.compile(rb'\[.*@.*\]\$'), pexpect.EOF, pexpect.TIMEOUT]
+
+def _session_cache_path(username):
+    """Path of the per-user session cache file"""
+    return os.path.join(os.path.expanduser('~/.config/my_hpc_app'),
+                        f"session_{username}.json")
+
+def save_cached_session(username, node_info):
+    """
+    Persist a successful login's node info for short-lived reuse
+
+    Args:
+        username (str): Username
+        node_info (str): Node information from the login
+    """
+    try:
+        cache_dir = os.path.expanduser('~/.config/my_hpc_app')
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+        key_path = os.path.join(os.path.expanduser('~/.ssh'), f"{username}{APP_MARKER}")
+        payload = {
+            'node_info': node_info,
+            'ts': time.time(),
+            'key_mtime': os.path.getmtime(key_path) if os.path.exists(key_path) else None
+        }
+        cache_path = _session_cache_path(username)
+        with open(cache_path, 'w') as f:
+            json.dump(payload, f)
+        os.chmod(cache_path, 0o600)
+    except Exception as e:
+        logging.warning(f"Failed to save session cache for {username}: {e}")
+
+def load_cached_session(username, ttl=SESSION_CACHE_TTL):
+    """
+    Return cached node info from a recent successful login, or None
+
+    The cache is only honored while its timestamp is within the TTL and
+    the user's key file hasn't changed since it was written.
+
+    Args:
+        username (str): Username
+        ttl (int): Maximum cache age in seconds
+
+    Returns:
+        str: Cached node info, or None if absent/stale
+    """
+    try:
+        cache_path = _session_cache_path(username)
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, 'r') as f:
+            payload = json.load(f)
+
+        if time.time() - payload.get('ts', 0) > ttl:
+            return None
+
+        key_path = os.path.join(os.path.expanduser('~/.ssh'), f"{username}{APP_MARKER}")
+        if not os.path.exists(key_path):
+            return None
+        if payload.get('key_mtime') != os.path.getmtime(key_path):
+            return None
+
+        return payload.get('node_info')
+    except Exception:
+        return None
+
+def clear_cached_session(username):
+    """Remove a user's session cache file if present"""
+    try:
+        cache_path = _session_cache_path(username)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+    except Exception as e:
+        logging.warning(f"Failed to clear session cache for {username}: {e}")
+
+# Cached user list keyed on the ~/.ssh directory mtime: adding or
+# removing a key bumps the directory mtime, so the cache self-invalidates
+_users_cache = None
+
+def invalidate_users_cache():
+    """Drop the cached user list so the next lookup rescans ~/.ssh"""
+    global _users_cache
+    _users_cache = None
+
 def get_all_existing_users():
     """
     Get a list of all users with existing SSH keys
-    
+
     Returns:
         list: List of users, each item is a dictionary containing username and key_path
     """
+    global _users_cache
     users = []
     ssh_dir = os.path.expanduser('~/.ssh')
-    
-    if not os.path.exists(ssh_dir):
+
+    try:
+        dir_mtime = os.stat(ssh_dir).st_mtime_ns
+    except OSError:
         return users
-    
-    for file in os.listdir(ssh_dir):
-        if file.endswith(APP_MARKER) and not file.endswith('.pub'):
-            username = file.replace(APP_MARKER, '')
-            key_path = os.path.join(ssh_dir, file)
-            
-            if os.access(key_path, os.R_OK) and os.path.exists(f"{key_path}.pub"):
+
+    if _users_cache is not None and _users_cache[0] == dir_mtime:
+        return _users_cache[1]
+
+    # One scandir pass: the public-key check is a set lookup and the
+    # mtime comes from the cached DirEntry stat, instead of a separate
+    # exists()+getmtime() stat pair per key
+    try:
+        with os.scandir(ssh_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return users
+
+    for name, entry in entries.items():
+        if name.endswith(APP_MARKER) and not name.endswith('.pub'):
+            if f"{name}.pub" in entries and os.access(entry.path, os.R_OK):
                 users.append({
-                    'username': username,
-                    'key_path': key_path,
-                    'last_used': os.path.getmtime(key_path)
+                    'username': name.replace(APP_MARKER, ''),
+                    'key_path': entry.path,
+                    'last_used': entry.stat().st_mtime
                 })
     
     # Sort by last used time
     users.sort(key=lambda x: x['last_used'], reverse=True)
+    _users_cache = (dir_mtime, users, {u['username']: u for u in users})
     return users
 
+def get_user_record(username):
+    """
+    Look up one saved user's record by username
+
+    Backed by the same mtime-keyed cache as get_all_existing_users plus
+    a by-name index, so repeated lookups (each widget resolves its key
+    path on creation) don't rescan ~/.ssh or linear-scan the user list.
+
+    Args:
+        username (str): Username
+
+    Returns:
+        dict: The user's record, or None if no key exists for them
+    """
+    get_all_existing_users()
+    if _users_cache is None:
+        return None
+    return _users_cache[2].get(username)
+
 def delete_user_key(username):
     """
     Delete a user's SSH key
@@ -66,7 +189,9 @@ def delete_user_key(username):
         if os.path.exists(pub_key_path):
             os.remove(pub_key_path)
             logging.info(f"Deleted public key: {pub_key_path}")
-            
+
+        invalidate_users_cache()
+        clear_cached_session(username)
         return True
     except Exception as e:
         logging.error(f"Error deleting key: {e}")
@@ -125,16 +250,18 @@ def login_with_password(uc_id, password, duo_code=None):
             return False, None
         
         # Use the imported generate_and_upload_ssh_key to log in and upload the key
-        result = generate_and_upload_ssh_key(
+        result, node_info = generate_and_upload_ssh_key(
             username=uc_id,
             password=password,
             host=HPC_SERVER,
             force=True
         )
-        
+
         if result:
-            # Get node information
-            node_info = get_node_info_via_key(uc_id)
+            # The upload session already fetched node info; only fall
+            # back to a separate connection if it came back empty
+            if node_info is None:
+                node_info = get_node_info_via_key(uc_id)
             return True, node_info
         else:
             return False, None
@@ -156,12 +283,12 @@ def get_node_info(child):
     try:
         # Send hostname command
         child.sendline('hostname')
-        child.expect([r'\[.*@.*\]\$', pexpect.EOF, pexpect.TIMEOUT], timeout=5)
+        child.expect(_PROMPT_PATTERNS, timeout=5)
         output = child.before.decode()
-        
+
         # Send node information command
         child.sendline('sinfo -N | grep $(hostname)')
-        child.expect([r'\[.*@.*\]\$', pexpect.EOF, pexpect.TIMEOUT], timeout=5)
+        child.expect(_PROMPT_PATTERNS, timeout=5)
         node_info = child.before.decode()
         
         return f"Hostname: {output.strip()}\nNode Info: {node_info.strip()}"
@@ -198,7 +325,11 @@ def get_node_info_via_key(uc_id):
                 hostname=HPC_SERVER,
                 username=uc_id,
                 key_filename=key_path,
-                look_for_keys=False
+                look_for_keys=False,
+                allow_agent=False,
+                timeout=10,
+                banner_timeout=10,
+                auth_timeout=10
             )
             
             logging.debug(f"[AuthModule] SSH connection established, requesting hostname")
@@ -279,7 +410,9 @@ def get_node_info_from_key(uc_id):
         logging.info(f"[AuthModule] Establishing SSH connection to {HPC_SERVER} to get node information")
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        client.connect(hostname=HPC_SERVER, username=uc_id, key_filename=key_path)
+        client.connect(hostname=HPC_SERVER, username=uc_id, key_filename=key_path,
+                       look_for_keys=False, allow_agent=False,
+                       timeout=10, banner_timeout=10, auth_timeout=10)
         
         # Get node information
         logging.debug(f"[AuthModule] Requesting node information via SSH")
@@ -344,7 +477,8 @@ def check_and_login_with_key(specific_username=None):
                     logging.info(f"[AuthModule] Establishing SSH connection to {HPC_SERVER} to verify key for {username}")
                     client = paramiko.SSHClient()
                     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                    client.connect(hostname=HPC_SERVER, username=username, key_filename=key_path, timeout=5)
+                    client.connect(hostname=HPC_SERVER, username=username, key_filename=key_path,
+                                   look_for_keys=False, allow_agent=False, timeout=5)
                     
                     # Test if the connection works
                     stdin, stdout, stderr = client.exec_command('hostname')
@@ -382,16 +516,17 @@ def verify_credentials(uc_id, password, duo_code):
     """
     logging.info("Using verify_credentials function (backward compatibility)")
     # Call the new generate_and_upload_ssh_key function
-    result = generate_and_upload_ssh_key(
+    result, node_info = generate_and_upload_ssh_key(
         username=uc_id,
         password=password,
         host=HPC_SERVER,
         force=True
     )
-    
+
     if result:
         # Get and save node information
-        node_info = get_node_info_via_key(uc_id)
+        if node_info is None:
+            node_info = get_node_info_via_key(uc_id)
         global LAST_NODE_INFO
         LAST_NODE_INFO = node_info
         return True
@@ -424,7 +559,7 @@ def test():
     username = input("Enter username: ")
     password = input("Enter password: ")
     
-    result = generate_and_upload_ssh_key(
+    result, _ = generate_and_upload_ssh_key(
         username=username,
         password=password,
         host=HPC_SERVER,
@@ -6,12 +6,51 @@ import paramiko
 import re
 import time
 import threading
+from enum import IntEnum
+from typing import NamedTuple
 from PyQt5.QtCore import QObject, pyqtSignal
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class NodeState(IntEnum):
+    """Node occupancy states
+
+    Integer codes so consumers can dispatch (e.g. pick a display color)
+    with a list index instead of matching display strings.
+    """
+    IDLE = 0
+    PARTIAL = 1
+    FULL = 2
+    FAULT = 3
+
+
+class NodeRow(NamedTuple):
+    """One node's parsed sinfo record
+
+    A fixed-slot record instead of a per-node dict: attribute access is
+    cheaper than string-keyed lookups on the refresh hot path and each
+    node carries no hash table of its own.
+    """
+    name: str
+    alloc_cpus: int
+    idle_cpus: int
+    other_cpus: int
+    total_cpus: int
+    memory: str
+    alloc_mem: str
+    has_gpu: bool
+    gpu_type: str
+    gpu_count: int
+    used_gpus: int
+    cpu_usage: float
+    memory_usage: float
+    gpu_usage: float
+    state: str
+    state_code: int
+
+
 class NodeStatusManager(QObject):
     """Node status manager for querying HPC cluster node information"""
     
@@ -135,32 +174,44 @@ class NodeStatusManager(QObject):
                 self.connect_ssh()
                 raise
     
-    def get_all_nodes(self):
+    def get_all_nodes(self, cancel_event=None):
         """
         Get information for all nodes
-        
+
+        Args:
+            cancel_event: Optional threading.Event; when set, the fetch
+                returns early with an empty result instead of parsing
+                and emitting stale data
+
         Returns:
             list: List of node information
         """
         current_time = time.time()
         # Check if cache is valid
-        if (self.data_cache['nodes_data'] and 
+        if (self.data_cache['nodes_data'] and
             current_time - self.data_cache['last_refresh'] < self.data_cache['refresh_interval']):
             return self.data_cache['nodes_data']
-        
+
+        if cancel_event is not None and cancel_event.is_set():
+            return []
+
         # Use sinfo command to get node information
         cmd = 'sinfo -N -O "NodeList:20,CPUsState:14,Memory:9,AllocMem:10,Gres:14,GresUsed:22"'
         try:
             output = self.execute_ssh_command(cmd)
+            # The caller may have given up (e.g. widget closing) while
+            # the SSH round-trip was in flight
+            if cancel_event is not None and cancel_event.is_set():
+                return []
             nodes_data = self._parse_nodes_info(output)
-            
+
             # Update cache
             self.data_cache['nodes_data'] = nodes_data
             self.data_cache['last_refresh'] = current_time
-            
+
             # Emit signal
             self.nodes_updated.emit(nodes_data)
-            
+
             return nodes_data
         except Exception as e:
             self.error_occurred.emit(f"Failed to get node information: {str(e)}")
@@ -242,37 +293,42 @@ class NodeStatusManager(QObject):
             # Determine node state
             if other_cpus > 0:
                 state = "Error"
+                state_code = NodeState.FAULT
             elif alloc_cpus == total_cpus:
                 state = "Full"
+                state_code = NodeState.FULL
             elif alloc_cpus > 0:
                 state = "Partially Used"
+                state_code = NodeState.PARTIAL
             else:
                 state = "Idle"
+                state_code = NodeState.IDLE
             
             # Create node data
-            node = {
-                'name': node_name,
-                'alloc_cpus': alloc_cpus,
-                'idle_cpus': idle_cpus,
-                'other_cpus': other_cpus,
-                'total_cpus': total_cpus,
-                'memory': memory_gb,
-                'alloc_mem': alloc_mem_gb,
-                'has_gpu': gres != "(null)",
-                'gpu_type': gpu_type,
-                'gpu_count': gpu_count,
-                'used_gpus': used_gpus,
-                'cpu_usage': cpu_usage,
-                'memory_usage': memory_usage,
-                'gpu_usage': gpu_usage,
-                'state': state
-            }
-            
+            node = NodeRow(
+                name=node_name,
+                alloc_cpus=alloc_cpus,
+                idle_cpus=idle_cpus,
+                other_cpus=other_cpus,
+                total_cpus=total_cpus,
+                memory=memory_gb,
+                alloc_mem=alloc_mem_gb,
+                has_gpu=gres != "(null)",
+                gpu_type=gpu_type,
+                gpu_count=gpu_count,
+                used_gpus=used_gpus,
+                cpu_usage=cpu_usage,
+                memory_usage=memory_usage,
+                gpu_usage=gpu_usage,
+                state=state,
+                state_code=state_code
+            )
+
             # Use node name as key, retain more resource records when merging duplicate nodes
             if node_name in nodes_dict:
                 existing_node = nodes_dict[node_name]
                 # If new node has GPU but existing node doesn't, replace
-                if node['has_gpu'] and not existing_node['has_gpu']:
+                if node.has_gpu and not existing_node.has_gpu:
                     nodes_dict[node_name] = node
                 # If both are the same or new node doesn't have GPU, retain existing node information
             else:
@@ -332,7 +388,7 @@ class NodeStatusManager(QObject):
         }
         
         for node in nodes:
-            if node['has_gpu']:
+            if node.has_gpu:
                 grouped['gpu_nodes'].append(node)
             else:
                 grouped['cpu_nodes'].append(node)
@@ -349,13 +405,13 @@ class NodeStatusManager(QObject):
         nodes = self.get_all_nodes()
         
         total_nodes = len(nodes)
-        used_nodes = sum(1 for n in nodes if n['alloc_cpus'] > 0)
-        
-        total_cpus = sum(n['total_cpus'] for n in nodes)
-        used_cpus = sum(n['alloc_cpus'] for n in nodes)
-        
-        total_gpus = sum(n['gpu_count'] for n in nodes if n['has_gpu'])
-        used_gpus = sum(n['used_gpus'] for n in nodes if n['has_gpu'])
+        used_nodes = sum(1 for n in nodes if n.alloc_cpus > 0)
+
+        total_cpus = sum(n.total_cpus for n in nodes)
+        used_cpus = sum(n.alloc_cpus for n in nodes)
+
+        total_gpus = sum(n.gpu_count for n in nodes if n.has_gpu)
+        used_gpus = sum(n.used_gpus for n in nodes if n.has_gpu)
         
         # Calculate utilization
         node_usage = (used_nodes / total_nodes * 100) if total_nodes > 0 else 0
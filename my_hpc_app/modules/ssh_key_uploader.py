@@ -3,6 +3,7 @@
 
 import os
 import paramiko
+import socket
 import subprocess
 import time
 import argparse
@@ -22,7 +23,10 @@ def generate_and_upload_ssh_key(username, password, host='hpc3.rcic.uci.edu', po
         force (bool): Whether to force overwrite existing key
     
     Returns:
-        bool: True if successful, False if failed
+        tuple: (success, node_info)
+            - success (bool): True if the key was uploaded
+            - node_info (str): Node information fetched on the same
+              session, or None if it could not be retrieved
     """
     home_dir = os.path.expanduser("~")
     ssh_dir = os.path.join(home_dir, ".ssh")
@@ -37,7 +41,7 @@ def generate_and_upload_ssh_key(username, password, host='hpc3.rcic.uci.edu', po
     if os.path.exists(key_file) and not force:
         print(f"SSH key already exists at {key_file}")
         print("Operation cancelled. Use force=True to overwrite")
-        return False
+        return False, None
 
     # Generate SSH key pair
     try:
@@ -48,16 +52,24 @@ def generate_and_upload_ssh_key(username, password, host='hpc3.rcic.uci.edu', po
         print(f"SSH key generated: {key_file}")
     except subprocess.CalledProcessError as e:
         print(f"Error generating SSH key: {e}")
-        return False
+        return False, None
 
     # Read public key content
     with open(public_key_file, "r") as f:
         public_key = f.read().strip()
 
-    # Use keyboard-interactive + Duo
-    transport = paramiko.Transport((host, port))
+    # Use keyboard-interactive + Duo. Connect through an explicitly
+    # timed-out socket so an unreachable or stalled server fails in
+    # seconds instead of hanging on the OS default TCP timeout
     try:
-        transport.start_client()
+        sock = socket.create_connection((host, port), timeout=10)
+    except OSError as e:
+        print(f"Connection to {host}:{port} failed: {e}")
+        return False, None
+    transport = paramiko.Transport(sock)
+    transport.banner_timeout = 10
+    try:
+        transport.start_client(timeout=10)
 
         # Callback function to handle "Password:" (system account password) and Duo prompts
         def duo_handler(title, instructions, prompt_list):
@@ -78,7 +90,7 @@ def generate_and_upload_ssh_key(username, password, host='hpc3.rcic.uci.edu', po
 
         if not transport.is_authenticated():
             print("Authentication failed: Please check username, password, or DUO authentication status")
-            return False
+            return False, None
 
         # Create SSHClient and bind to authenticated Transport
         client = paramiko.SSHClient()
@@ -87,13 +99,13 @@ def generate_and_upload_ssh_key(username, password, host='hpc3.rcic.uci.edu', po
 
     except paramiko.AuthenticationException as e:
         print(f"Authentication failed: {e}")
-        return False
+        return False, None
     except paramiko.SSHException as e:
         print(f"SSH connection error: {e}")
-        return False
+        return False, None
     except Exception as e:
         print(f"An error occurred: {e}")
-        return False
+        return False, None
 
     # Upload public key to server's authorized_keys
     try:
@@ -107,11 +119,22 @@ def generate_and_upload_ssh_key(username, password, host='hpc3.rcic.uci.edu', po
         exit_status = stdout.channel.recv_exit_status()
         if exit_status == 0:
             print("SSH key successfully uploaded to server")
-            return True
+            # Fetch node info on this already-authenticated session so
+            # callers don't need to open a second SSH connection
+            node_info = None
+            try:
+                stdin, stdout, stderr = client.exec_command('hostname')
+                hostname = stdout.read().decode().strip()
+                stdin, stdout, stderr = client.exec_command('sinfo -N | grep $(hostname)')
+                info = stdout.read().decode().strip()
+                node_info = f"Hostname: {hostname}\nNode Info: {info}"
+            except Exception as e:
+                print(f"Could not fetch node info on the upload session: {e}")
+            return True, node_info
         else:
             error = stderr.read().decode()
             print(f"Error uploading SSH key: {error}")
-            return False
+            return False, None
     finally:
         client.close()
 
@@ -130,7 +153,7 @@ def main():
     
     args = parser.parse_args()
     
-    result = generate_and_upload_ssh_key(
+    result, _ = generate_and_upload_ssh_key(
         username=args.username,
         password=args.password,
         host=args.host,
@@ -138,7 +161,7 @@ def main():
         key_comment=args.comment,
         force=args.force
     )
-    
+
     if result:
         print("Operation completed successfully!")
     else:
@@ -154,7 +177,7 @@ def test():
       3) Upload public key
     """
     print("Running with test parameters...")
-    result = generate_and_upload_ssh_key(
+    result, _ = generate_and_upload_ssh_key(
         username="liangys5",       # Replace with your own username
         password="GoodLuck2023!",  # Replace with your real password
         host="hpc3.rcic.uci.edu",
@@ -8,15 +8,11 @@ Checks for updates and provides functionality to download and apply them
 
 import os
 import sys
-import json
 import platform
 import tempfile
-import shutil
 import logging
 import subprocess
-import requests
-from PyQt5.QtCore import QObject, pyqtSignal, QThread
-from packaging import version
+from PyQt5.QtCore import QObject, pyqtSignal, QThread, QTimer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -49,6 +45,11 @@ class UpdateWorker(QThread):
         super().__init__(parent)
         self.check_only = check_only
         self.cancel_requested = False
+        self._response = None
+        # Progress counters polled by the GUI thread (see UpdateManager)
+        # instead of emitting a cross-thread signal for every chunk
+        self._downloaded_bytes = 0
+        self._total_size = 0
         
     def run(self):
         """Main worker function that runs in a separate thread"""
@@ -85,6 +86,11 @@ class UpdateWorker(QThread):
         Returns:
             dict: Update information if update available, None otherwise
         """
+        # Imported lazily so app startup doesn't pay for the requests/
+        # packaging import chains unless an update check actually runs
+        import requests
+        from packaging import version
+
         try:
             # Make request to GitHub API
             logger.info(f"Checking for updates from {GITHUB_API_URL}")
@@ -157,6 +163,8 @@ class UpdateWorker(QThread):
         Returns:
             str: Path to downloaded file, None if download failed
         """
+        import requests
+
         try:
             download_url = update_info.get('download_url')
             if not download_url:
@@ -165,33 +173,59 @@ class UpdateWorker(QThread):
                 
             asset_name = update_info.get('asset_name')
             download_path = os.path.join(tempfile.gettempdir(), asset_name)
-            
+            # Download to a .part file and atomically rename on success so
+            # a crash mid-download never leaves a corrupt installer behind
+            part_path = download_path + '.part'
+
             logger.info(f"Downloading update from {download_url} to {download_path}")
             self.update_progress.emit(10, f"Downloading {asset_name}...")
-            
+
+            # Resume a previous partial download if one exists (release
+            # assets are immutable per version, so the bytes won't change)
+            resume_from = 0
+            headers = {}
+            if os.path.exists(part_path):
+                resume_from = os.path.getsize(part_path)
+                if resume_from > 0:
+                    headers['Range'] = f'bytes={resume_from}-'
+
             # Stream download to show progress
-            response = requests.get(download_url, stream=True, timeout=60)
+            response = requests.get(download_url, stream=True, timeout=60, headers=headers)
+            if resume_from > 0 and response.status_code != 206:
+                # Server ignored the range request; start over
+                resume_from = 0
             response.raise_for_status()
-            
+            self._response = response
+
             # Get file size if available
             total_size = int(response.headers.get('content-length', 0))
-            
-            # Download with progress tracking
-            downloaded = 0
-            with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.cancel_requested:
-                        logger.info("Download canceled")
-                        return None
-                        
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Update progress if we know the total size
-                        if total_size > 0:
-                            progress = int(downloaded / total_size * 90) + 10  # 10-100%
-                            self.update_progress.emit(progress, f"Downloading: {progress}%")
+            if total_size > 0:
+                total_size += resume_from
+            self._total_size = total_size
+            self._downloaded_bytes = resume_from
+
+            # Download with progress tracking. Cancellation closes the
+            # response socket (see cancel()), so the hot loop doesn't
+            # need a per-chunk flag check
+            downloaded = resume_from
+            try:
+                with open(part_path, 'ab' if resume_from > 0 else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            # Store progress for the GUI-side timer to pick up;
+                            # no per-chunk signal emission across threads
+                            self._downloaded_bytes = downloaded
+                    f.flush()
+                    os.fsync(f.fileno())
+            except (requests.exceptions.ChunkedEncodingError, OSError):
+                if self.cancel_requested:
+                    logger.info("Download canceled")
+                    return None
+                raise
+
+            os.replace(part_path, download_path)
             
             self.update_progress.emit(100, "Download complete")
             logger.info(f"Download completed: {download_path}")
@@ -204,6 +238,12 @@ class UpdateWorker(QThread):
     def cancel(self):
         """Cancel the update process"""
         self.cancel_requested = True
+        # Tear down the socket so iter_content raises immediately
+        if self._response:
+            try:
+                self._response.close()
+            except Exception:
+                pass
 
 class UpdateManager(QObject):
     """
@@ -221,6 +261,7 @@ class UpdateManager(QObject):
         """Initialize update manager"""
         super().__init__(parent)
         self.worker = None
+        self.progress_timer = None
         
     def check_for_updates(self, silent=False):
         """
@@ -265,10 +306,37 @@ class UpdateManager(QObject):
         self.worker.update_progress.connect(self.update_progress)
         self.worker.update_downloaded.connect(self.update_downloaded)
         self.worker.update_error.connect(self.update_error)
-        
+
+        # Poll download progress at 10 Hz on the GUI thread instead of
+        # receiving a queued signal for every downloaded chunk
+        self.worker.update_downloaded.connect(self._stop_progress_timer)
+        self.worker.update_error.connect(self._stop_progress_timer)
+
+        if self.progress_timer is None:
+            self.progress_timer = QTimer(self)
+            self.progress_timer.setInterval(100)
+            self.progress_timer.timeout.connect(self._emit_download_progress)
+        self.progress_timer.start()
+
         # Put update info in worker and start
         self.worker._update_info = update_info
         self.worker.start()
+
+    def _emit_download_progress(self):
+        """Read the worker's progress counters and emit a progress signal"""
+        worker = self.worker
+        if not worker:
+            return
+
+        total = worker._total_size
+        if total > 0:
+            progress = int(worker._downloaded_bytes / total * 90) + 10  # 10-100%
+            self.update_progress.emit(progress, f"Downloading: {progress}%")
+
+    def _stop_progress_timer(self, *args):
+        """Stop polling progress once the download finishes or fails"""
+        if self.progress_timer:
+            self.progress_timer.stop()
     
     def apply_update(self, download_path):
         """
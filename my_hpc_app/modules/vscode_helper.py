@@ -2,17 +2,198 @@
 # -*- coding: utf-8 -*-
 
 import re
+import asyncio
 import logging
 import paramiko
 import threading
 import time
 import os
+import queue
+import shlex
+import socket
+from contextlib import contextmanager
+from functools import lru_cache
 from PyQt5.QtCore import QObject, pyqtSignal, QThread, Qt
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Patterns hit on every submit/poll/config-parse, compiled once at import
+_RE_SUBMITTED = re.compile(r'Submitted batch job (\d+)')
+_RE_HOSTNAME = re.compile(r'HostName\s+(\S+)')
+_RE_PORT = re.compile(r'Port\s+(\d+)')
+_RE_NODE = re.compile(r'Node:\s+(\S+)')
+# Field orders matching the -o format strings used in get_job_status
+_SQUEUE_FIELDS = ('job_name', 'job_id', 'status', 'node', 'cpus', 'memory', 'time_limit')
+_SACCT_FIELDS = ('job_name', 'job_id', 'status', 'node', 'cpus', 'memory', 'time_limit')
+# Cap on how much command output is buffered; polling only ever needs
+# the first few KB, so runaway output can't grow memory unbounded
+_MAX_COMMAND_OUTPUT = 65536
+# Sentinel marking command completion on the shared shell channel
+_SHELL_SENTINEL = "__HPC_APP_END__"
+_RE_SHELL_SENTINEL = re.compile(r'__HPC_APP_END__(\d+)__')
+# Matches one HPC App config block; group(1) is the job ID it belongs to
+_RE_HPC_BLOCK = re.compile(
+    r'# === BEGIN HPC App VSCode Configuration \(JobID: (\S+?)\) ===.*?'
+    r'# === END HPC App VSCode Configuration \(JobID: \1\) ===',
+    re.DOTALL
+)
+
+# Legacy algorithms dropped from the KEX proposal; the HPC login nodes
+# negotiate modern defaults, and a shorter proposal plus no compression
+# trims handshake work on every (re)connect
+_DISABLED_ALGORITHMS = {
+    'kex': [
+        'diffie-hellman-group1-sha1',
+        'diffie-hellman-group14-sha1',
+        'diffie-hellman-group-exchange-sha1',
+    ],
+    'macs': ['hmac-sha1', 'hmac-md5', 'hmac-sha1-96', 'hmac-md5-96'],
+}
+
+@lru_cache(maxsize=16)
+def _identity_file_for_user(username):
+    """Look up a user's SSH key path from stored user info (cached)"""
+    from modules.auth import get_all_existing_users
+    for user in get_all_existing_users():
+        if user['username'] == username:
+            return user['key_path']
+    return None
+
+class SSHConnectionPool:
+    """
+    Small pool of pre-authenticated SSH clients shared per connection target.
+
+    Polling, status checks and cancellation previously serialized behind a
+    single SSHClient; borrowing a client per command lets concurrent
+    operations proceed in parallel and survives a dropped transport without
+    blocking every caller behind one reconnect.
+    """
+
+    # Pools shared across VSCodeManager instances, keyed by connection target
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, hostname, username, key_path=None, password=None, size=4):
+        self.hostname = hostname
+        self.username = username
+        self.key_path = key_path
+        self.password = password
+        self._clients = queue.Queue(maxsize=size)
+
+        # Parse the local SSH config once so every pool replenish honors
+        # ProxyCommand for the login host without re-reading the file
+        self._ssh_cfg = paramiko.SSHConfig()
+        cfg_path = os.path.expanduser("~/.ssh/config")
+        if os.path.exists(cfg_path):
+            try:
+                with open(cfg_path) as f:
+                    self._ssh_cfg.parse(f)
+            except Exception as e:
+                logger.warning(f"[SSHConnectionPool] Unable to parse {cfg_path}: {e}")
+
+    @classmethod
+    def get(cls, hostname, username, key_path=None, password=None):
+        """Get (or create) the shared pool for a connection target"""
+        key = (hostname, username, key_path)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls(hostname, username, key_path, password)
+                cls._pools[key] = pool
+        return pool
+
+    def _create_client(self):
+        """Build and authenticate a new SSH client"""
+        logger.info(f"[SSHConnectionPool] Establishing new SSH connection to {self.hostname}")
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        # Honor a ProxyCommand for the login host from the cached config
+        sock = None
+        host_cfg = self._ssh_cfg.lookup(self.hostname)
+        if 'proxycommand' in host_cfg:
+            sock = paramiko.ProxyCommand(host_cfg['proxycommand'])
+
+        if self.key_path:
+            client.connect(
+                hostname=self.hostname,
+                username=self.username,
+                key_filename=self.key_path,
+                timeout=15,
+                look_for_keys=False,
+                allow_agent=False,
+                compress=False,
+                disabled_algorithms=_DISABLED_ALGORITHMS,
+                sock=sock
+            )
+        elif self.password:
+            client.connect(
+                hostname=self.hostname,
+                username=self.username,
+                password=self.password,
+                timeout=15,
+                look_for_keys=False,
+                allow_agent=False,
+                compress=False,
+                disabled_algorithms=_DISABLED_ALGORITHMS,
+                sock=sock
+            )
+        else:
+            raise ValueError("Key path or password must be provided")
+
+        # Keep-alive so idle pooled connections survive NAT/firewall timeouts
+        transport = client.get_transport()
+        if transport:
+            transport.set_keepalive(30)
+
+        return client
+
+    @contextmanager
+    def borrow(self):
+        """Borrow a live client from the pool, creating one if needed"""
+        try:
+            client = self._clients.get_nowait()
+        except queue.Empty:
+            client = None
+
+        # Discard stale clients whose transport died while pooled
+        if client is not None:
+            transport = client.get_transport()
+            if not transport or not transport.is_active():
+                try:
+                    client.close()
+                except Exception:
+                    pass
+                client = None
+
+        if client is None:
+            client = self._create_client()
+
+        try:
+            yield client
+        finally:
+            self._return(client)
+
+    def dedicated_client(self):
+        """Create a client outside the pool for long-lived channels (SFTP)"""
+        return self._create_client()
+
+    def _return(self, client):
+        """Return a client to the pool, closing it if dead or pool is full"""
+        transport = client.get_transport()
+        if transport and transport.is_active():
+            try:
+                self._clients.put_nowait(client)
+                return
+            except queue.Full:
+                pass
+        try:
+            client.close()
+        except Exception:
+            pass
+
 class VSCodeManager(QObject):
     """
     VSCode server manager responsible for submitting and managing VSCode server jobs
@@ -25,134 +206,257 @@ class VSCodeManager(QObject):
     error_occurred = pyqtSignal(str)  # Error signal
     ssh_config_added = pyqtSignal(str, str)  # SSH config added signal (job_id, hostname)
     ssh_config_removed = pyqtSignal(str)  # SSH config removed signal (job_id)
-    
-    def __init__(self, hostname, username, key_path=None, password=None):
+
+    # Single background asyncio loop shared by all managers; per-job polling
+    # runs as coroutines on it instead of one OS thread per job
+    _loop = None
+    _loop_lock = threading.Lock()
+
+    @classmethod
+    def _ensure_loop(cls):
+        """Lazily start the shared polling event loop in a daemon thread"""
+        with cls._loop_lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=cls._loop.run_forever,
+                    daemon=True,
+                    name="vscode-poll-loop"
+                ).start()
+        return cls._loop
+
+    def _run_blocking(self, func, *args):
+        """Run a blocking call in the loop's executor from a coroutine"""
+        return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def __init__(self, hostname, username, key_path=None, password=None,
+                 poll_interval_min=None, poll_interval_max=None):
         """
         Initialize VSCode manager
-        
+
         Args:
             hostname: HPC hostname
             username: Username
             key_path: SSH key path
             password: SSH password
+            poll_interval_min: Floor of the status poll interval (seconds)
+            poll_interval_max: Backoff cap of the status poll interval (seconds)
         """
         super().__init__()
         self.hostname = hostname
         self.username = username
         self.key_path = key_path
         self.password = password
-        self.lock = threading.Lock()  # Thread lock to ensure SSH connection safety
-        
-        # Cache SSH client
-        self._ssh_client = None
-        
+        self.poll_interval_min = poll_interval_min or self.POLL_MIN_INTERVAL
+        self.poll_interval_max = poll_interval_max or self.POLL_MAX_INTERVAL
+
+        # Pool of SSH connections shared per target; commands borrow a client
+        # instead of serializing behind a single connection
+        self._pool = SSHConnectionPool.get(hostname, username, key_path, password)
+
+        # Resolve the identity file once; the poll loop writes SSH config for
+        # every new job and shouldn't re-scan the user list each time
+        self._resolved_identity_file = (
+            key_path
+            or _identity_file_for_user(username)
+            or os.path.expanduser(f"~/.ssh/{username}_hpc_app_key"))
+
         # Current running VSCode job information
         self.current_job = None
-        
-        # Track jobs with written config
-        self.config_written_jobs = set()
-        
-        # Attempt to connect
-        self.connect_ssh()
-    
+
+        # Jobs whose SSH config has been written (dict for atomic
+        # check-and-set via setdefault; see _claim_config_write)
+        self.config_written_jobs = {}
+
+        # Jobs polled by the central poller: job_id -> state dict
+        self._tracked_jobs = {}
+        self._poller_task = None
+
+        # Last (status, node) emitted per job, to coalesce no-op updates
+        self._last_emitted_status = {}
+
+        # Incremental readers of job output files: job_id -> handle state
+        self._sftp_files = {}
+        self._sftp = None
+        self._sftp_client = None
+
+        # Status cache fed by the streaming squeue watcher:
+        # job_id -> (monotonic timestamp, status dict)
+        self._status_cache = {}
+        self._watcher_thread = None
+
+        # Short-TTL result caches so signal bursts from the UI collapse
+        # into one SSH round trip: job_id -> (monotonic timestamp, result)
+        self._status_result_cache = {}
+        self._config_cache = {}
+
+        # In-memory copy of ~/.ssh/config, invalidated whenever the
+        # file's mtime changes (e.g. the user edited it by hand)
+        self._ssh_config_text = None
+        self._ssh_config_mtime = None
+
+        # Whether the cluster's squeue supports --only-job-state
+        # (cheap state-only queries); probed lazily on first use
+        self._only_job_state = None
+
+        # Set on shutdown so in-flight commands stop waiting on a
+        # half-dead channel instead of blocking application exit
+        self._cancel_event = threading.Event()
+
+        # No eager connect: the pool opens its first SSH connection on
+        # the first borrow (i.e. the first executed command), so manager
+        # construction never blocks the UI thread on the network
+
     def connect_ssh(self):
-        """Connect to SSH server"""
+        """Verify that an SSH connection to the server can be obtained"""
         try:
-            if self._ssh_client and self._ssh_client.get_transport() and self._ssh_client.get_transport().is_active():
-                logger.debug(f"[VSCodeManager] Reusing existing SSH connection to {self.hostname} for VSCode server operations")
-                return True
-            
-            # If there is an old connection, close it first
-            if self._ssh_client:
-                try:
-                    logger.debug(f"[VSCodeManager] Closing old SSH connection")
-                    self._ssh_client.close()
-                except:
-                    pass
-            
-            # Create a new SSH client
-            logger.info(f"[VSCodeManager] Establishing new SSH connection to {self.hostname} for VSCode server operations")
-            self._ssh_client = paramiko.SSHClient()
-            self._ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Connect using key or password
-            if self.key_path:
-                self._ssh_client.connect(
-                    hostname=self.hostname,
-                    username=self.username,
-                    key_filename=self.key_path,
-                    timeout=15,
-                    look_for_keys=False,
-                    allow_agent=False
-                )
-            elif self.password:
-                self._ssh_client.connect(
-                    hostname=self.hostname,
-                    username=self.username,
-                    password=self.password,
-                    timeout=15,
-                    look_for_keys=False,
-                    allow_agent=False
-                )
-            else:
-                error_msg = "Key path or password must be provided"
-                logger.error(f"[VSCodeManager] {error_msg}")
-                self.error_occurred.emit(error_msg)
-                return False
-            
-            logger.info(f"[VSCodeManager] SSH connection to {self.hostname} established successfully")
+            with self._pool.borrow():
+                pass
             return True
         except Exception as e:
             error_msg = f"SSH connection failed: {str(e)}"
             logger.error(f"[VSCodeManager] SSH connection to {self.hostname} failed: {e}")
             self.error_occurred.emit(error_msg)
             return False
-    
-    def _close_ssh_client(self):
-        """Safely close SSH client connection"""
-        if self._ssh_client:
-            try:
-                logger.debug(f"[VSCodeManager] Closing SSH connection to {self.hostname}")
-                self._ssh_client.close()
-            except Exception as e:
-                logger.error(f"[VSCodeManager] Error closing SSH connection: {e}")
-                pass
-            self._ssh_client = None
-    
+
+    def shutdown(self):
+        """
+        Stop background polling and abort in-flight SSH commands
+
+        Called on application exit so a stalled channel can't keep a
+        worker thread alive and block shutdown.
+        """
+        self._cancel_event.set()
+        self._tracked_jobs.clear()
+
     def execute_ssh_command(self, command):
         """
         Execute SSH command and return result
-        
+
         Args:
             command: Command to execute
-            
+
         Returns:
             str: Output of the command
         """
         try:
-            # Ensure there is a connection
-            if not self._ssh_client or not self._ssh_client.get_transport() or not self._ssh_client.get_transport().is_active():
-                logger.info(f"[VSCodeManager] SSH connection not active, reconnecting to {self.hostname}")
-                if not self.connect_ssh():
-                    raise Exception("Unable to connect to SSH server")
-            
-            # Execute command
+            # Execute command on a pooled connection
             logger.debug(f"[VSCodeManager] Executing command on {self.hostname}: {command}")
-            stdin, stdout, stderr = self._ssh_client.exec_command(command, timeout=30)
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
-            
-            # If there is an error and no output, raise an exception
-            if error and not output:
-                logger.error(f"[VSCodeManager] Command error on {self.hostname}: {error}")
-                raise Exception(f"Command execution error: {error}")
-            
+            with self._pool.borrow() as client:
+                exit_status = 0
+                try:
+                    # Reuse the client's persistent shell channel to skip
+                    # the SSH channel-open round trip per command
+                    output, error, exit_status = self._exec_on_shared_shell(client, command)
+                except Exception as shell_error:
+                    logger.debug(f"[VSCodeManager] Shared shell failed ({shell_error}), "
+                                 "falling back to a one-off channel")
+                    output, error = self._exec_bounded(client, command)
+
+            # A failed command with no output is an error; the sentinel's
+            # exit status catches failures that print nothing to stderr
+            if not output and (error or exit_status != 0):
+                detail = error or f"exit status {exit_status}"
+                logger.error(f"[VSCodeManager] Command error on {self.hostname}: {detail}")
+                raise Exception(f"Command execution error: {detail}")
+
             return output
         except Exception as e:
             logger.error(f"[VSCodeManager] Command execution failed on {self.hostname}: {e}")
-            # Attempt to reconnect
-            self.connect_ssh()
             raise Exception(f"Command execution failed: {str(e)}")
+
+    def _exec_bounded(self, client, command, timeout=30):
+        """
+        Execute a command on a one-off channel with bounded buffering
+
+        Streams stdout/stderr in fixed-size chunks up to a hard cap
+        instead of stdout.read()/stderr.read(), which block until EOF and
+        buffer arbitrarily large output in memory.
+
+        Returns:
+            tuple: (stdout text, stderr text)
+        """
+        stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+        chan = stdout.channel
+        output_buf = bytearray()
+        error_buf = bytearray()
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            if self._cancel_event.is_set():
+                chan.close()
+                raise Exception("Command cancelled")
+            drained = False
+            if chan.recv_ready():
+                output_buf += chan.recv(8192)
+                drained = True
+            if chan.recv_stderr_ready():
+                error_buf += chan.recv_stderr(8192)
+                drained = True
+
+            if len(output_buf) + len(error_buf) >= _MAX_COMMAND_OUTPUT:
+                logger.warning(f"[VSCodeManager] Output cap reached for command: {command}")
+                chan.close()
+                break
+
+            if chan.exit_status_ready() and not chan.recv_ready() and not chan.recv_stderr_ready():
+                break
+
+            if not drained:
+                time.sleep(0.05)
+
+        return (output_buf.decode('utf-8', errors='replace'),
+                error_buf.decode('utf-8', errors='replace'))
+
+    def _exec_on_shared_shell(self, client, command, timeout=30):
+        """
+        Run a short command on the client's persistent shell channel
+
+        One /bin/sh session per pooled client handles all short commands;
+        completion is detected via a sentinel echo, avoiding a channel
+        open/close handshake for every squeue/sacct/cat call.
+
+        Returns:
+            tuple: (stdout text, stderr text, exit status)
+        """
+        chan = getattr(client, '_hpc_shell', None)
+        if chan is None or chan.closed:
+            chan = client.get_transport().open_session()
+            chan.settimeout(0.5)
+            # Plain sh without a pty: no command echo, separate stderr
+            chan.exec_command('/bin/sh')
+            client._hpc_shell = chan
+
+        chan.send(f"{command}; echo {_SHELL_SENTINEL}$?__\n".encode('utf-8'))
+
+        buf = ""
+        error = ""
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._cancel_event.is_set():
+                chan.close()
+                raise Exception("Command cancelled")
+            if time.monotonic() > deadline:
+                chan.close()
+                raise Exception("Shared shell command timed out")
+            try:
+                # Short recv timeout keeps the loop responsive to
+                # cancellation; the deadline above bounds total time
+                data = chan.recv(8192)
+            except socket.timeout:
+                continue
+            except Exception:
+                chan.close()
+                raise
+            if not data:
+                chan.close()
+                raise Exception("Shared shell channel closed")
+            buf += data.decode('utf-8', errors='replace')
+            while chan.recv_stderr_ready():
+                error += chan.recv_stderr(8192).decode('utf-8', errors='replace')
+            match = _RE_SHELL_SENTINEL.search(buf)
+            if match:
+                return buf[:match.start()], error, int(match.group(1))
     
     def submit_vscode_job(self, cpus=2, memory="4G", gpu_type=None, gpu_count=1, account=None, time_limit="8:00:00", use_free=False):
         """
@@ -174,28 +478,26 @@ class VSCodeManager(QObject):
         """
         if not account:
             raise ValueError("Billing account must be specified")
-        
-        # Connect to SSH
-        if not self.connect_ssh():
-            raise Exception("Unable to connect to SSH server")
-        
+
         try:
-            # Build sbatch command
-            cmd = "sbatch"
-            
-            # Add resource request parameters
-            cmd += f" --cpus-per-task={cpus}"
-            cmd += f" --mem={memory}"
-            cmd += f" --time={time_limit}"
-            cmd += f" --account={account}"
-            
+            # Build sbatch command as an argument list; shlex.join quotes
+            # each value so unusual account/memory strings can't break the
+            # remote command line
+            args = [
+                "sbatch",
+                f"--cpus-per-task={cpus}",
+                f"--mem={memory}",
+                f"--time={time_limit}",
+                f"--account={account}"
+            ]
+
             # 检查账户名称是否包含GPU字样，如果包含但未指定GPU，则自动分配any GPU
             account_contains_gpu = account and "gpu" in account.lower()
-            
+
             # 处理GPU选项
             if gpu_type is not None or account_contains_gpu:  # 如果指定了GPU或账户包含GPU字样
                 # 添加GPU分区
-                cmd += f" -p gpu"
+                args += ["-p", "gpu"]
 
                 # 如果账户包含GPU但用户未指定GPU类型，设置为任意GPU
                 if gpu_type is None and account_contains_gpu:
@@ -203,17 +505,18 @@ class VSCodeManager(QObject):
 
                 if gpu_type == "":  # 空字符串表示任何GPU
                     # 不指定GPU类型，让Slurm自动分配任何可用的GPU
-                    cmd += f" --gres=gpu:{gpu_count}"
+                    args.append(f"--gres=gpu:{gpu_count}")
                 else:  # 指定GPU类型
                     # 使用正确的格式：gpu:类型:数量
-                    cmd += f" --gres=gpu:{gpu_type}:{gpu_count}"
-            
+                    args.append(f"--gres=gpu:{gpu_type}:{gpu_count}")
+
             # Add free partition option (if needed)
             if use_free:
-                cmd += f" -p free"
-            
+                args += ["-p", "free"]
+
             # Add VSCode script path
-            cmd += " /opt/rcic/scripts/vscode-sshd.sh"
+            args.append("/opt/rcic/scripts/vscode-sshd.sh")
+            cmd = shlex.join(args)
             
             # Submit job
             logger.info(f"Submit job command: {cmd}")
@@ -223,7 +526,7 @@ class VSCodeManager(QObject):
             # Parse job ID
             job_id = None
             if output:
-                match = re.search(r'Submitted batch job (\d+)', output)
+                match = _RE_SUBMITTED.search(output)
                 if match:
                     job_id = match.group(1)
             
@@ -275,71 +578,59 @@ class VSCodeManager(QObject):
         Args:
             job_id: Job ID
         """
-        # Start a thread to monitor job status
-        threading.Thread(target=self._monitor_job_status, args=(job_id,), daemon=True).start()
-    
-    def _monitor_job_status(self, job_id):
+        # The central poller already tracks status, keeps current_job in
+        # sync and emits vscode_config_ready; just register the job
+        if job_id not in self._tracked_jobs:
+            self._start_poll_job_status(job_id)
+
+    def _next_delay(self, prev, changed):
+        """Exponential backoff delay that resets to the floor on a state change"""
+        if changed:
+            return self.poll_interval_min
+        return min(prev * 2, self.poll_interval_max)
+
+    def _emit_status_update(self, job_id, job_status):
         """
-        Monitor job status and get configuration information when the job is running
-        
-        Args:
-            job_id: Job ID
+        Emit vscode_job_status_updated only when something changed
+
+        A RUNNING job polled every few seconds would otherwise marshal an
+        identical dict across the thread boundary hundreds of times an
+        hour for no UI effect.
         """
-        try:
-            # Wait up to 60 minutes
-            max_wait_time = 60 * 60
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait_time:
-                # Check job status
-                cmd = f"squeue -j {job_id} -h -o '%T %N'"
-                try:
-                    output = self.execute_ssh_command(cmd)
-                    output = output.strip()
-                    
-                    if not output:
-                        # Job may have ended
-                        logger.warning(f"Job {job_id} may have ended, unable to get status")
-                        self.current_job['status'] = 'COMPLETED'
-                        self.vscode_job_status_updated.emit(self.current_job)
-                        return
-                    
-                    # Parse status and node
-                    parts = output.split()
-                    if len(parts) >= 1:
-                        status = parts[0]
-                        node = parts[1] if len(parts) > 1 else "Not assigned"
-                        
-                        # Update job information
-                        self.current_job['status'] = status
-                        self.current_job['node'] = node
-                        
-                        # Send status update signal
-                        self.vscode_job_status_updated.emit(self.current_job)
-                        
-                        # If the job is running, get configuration information
-                        if status == 'RUNNING':
-                            # Get job output file to parse configuration information
-                            config_info = self._parse_vscode_config(job_id)
-                            if config_info:
-                                self.current_job['config'] = config_info
-                                self.current_job['hostname'] = config_info.get('hostname')
-                                self.current_job['port'] = config_info.get('port')
-                                # Send configuration ready signal
-                                self.vscode_config_ready.emit(self.current_job)
-                                return
-                except Exception as e:
-                    logger.error(f"Error getting job status: {str(e)}")
-                
-                # Check every 10 seconds
-                time.sleep(10)
-            
-            # Timeout
-            logger.warning(f"Waiting for job {job_id} to run timed out")
-            self.error_occurred.emit(f"Waiting for job {job_id} to run timed out, please check job status")
-        except Exception as e:
-            logger.error(f"Error monitoring job status: {str(e)}")
-            self.error_occurred.emit(f"Error monitoring job status: {str(e)}")
+        config = job_status.get('config') or {}
+        key = (job_status.get('status'), job_status.get('node'),
+               config.get('hostname'), config.get('port'))
+        if self._last_emitted_status.get(job_id) == key:
+            return
+        self._last_emitted_status[job_id] = key
+        self.vscode_job_status_updated.emit(job_status)
+
+    def _claim_config_write(self, job_id):
+        """
+        Atomically claim the one-time SSH config write for a job
+
+        dict.setdefault is a single atomic check-and-set under the GIL,
+        so two concurrent pollers can't both see "not written yet" and
+        double-write the same config block.
+
+        Returns:
+            bool: True if this caller won the claim
+        """
+        token = object()
+        return self.config_written_jobs.setdefault(job_id, token) is token
+
+    def _sync_current_job(self, job_id, job_status=None, config=None):
+        """Mirror poller results into current_job when it is the same job"""
+        if not self.current_job or self.current_job.get('job_id') != job_id:
+            return
+        if job_status:
+            self.current_job['status'] = job_status.get('status')
+            if job_status.get('node'):
+                self.current_job['node'] = job_status['node']
+        if config:
+            self.current_job['config'] = config
+            self.current_job['hostname'] = config.get('hostname')
+            self.current_job['port'] = config.get('port')
     
     def _parse_vscode_config(self, job_id):
         """
@@ -351,15 +642,19 @@ class VSCodeManager(QObject):
         Returns:
             dict: Configuration information dictionary
         """
+        # Serve a recently parsed config without touching the server
+        cached = self._config_cache.get(job_id)
+        if cached and time.monotonic() - cached[0] < self.CONFIG_TTL:
+            return cached[1]
+
         try:
-            # Get job output file
-            cmd = f"cat vscode-sshd-{job_id}.out 2>/dev/null || echo 'Configuration file not found'"
-            output = self.execute_ssh_command(cmd)
-            
+            # Read the job output file incrementally over SFTP
+            output = self._read_job_output(job_id)
+
             logger.info(f"VSCode configuration file content:\n{output}")
-            
-            # If configuration file not found
-            if "Configuration file not found" in output:
+
+            # If configuration file not found (or empty so far)
+            if not output:
                 # Query job information
                 job_info = self.get_job_status(job_id)
                 node = job_info.get('node') if job_info else None
@@ -378,15 +673,16 @@ class VSCodeManager(QObject):
   StrictHostKeyChecking no"""
                     }
                     logger.info(f"Construct configuration using node information: {config}")
+                    self._config_cache[job_id] = (time.monotonic(), config)
                     return config
                 else:
                     logger.warning(f"Unable to get node information for job {job_id}")
                     return None
             
             # Parse hostname and port
-            hostname_match = re.search(r'HostName\s+(\S+)', output)
-            port_match = re.search(r'Port\s+(\d+)', output)
-            
+            hostname_match = _RE_HOSTNAME.search(output)
+            port_match = _RE_PORT.search(output)
+
             hostname = None
             port = None
             
@@ -394,7 +690,7 @@ class VSCodeManager(QObject):
                 hostname = hostname_match.group(1)
             else:
                 # Try to find hostname from node line
-                node_match = re.search(r'Node:\s+(\S+)', output)
+                node_match = _RE_NODE.search(output)
                 if node_match:
                     hostname = node_match.group(1)
             
@@ -409,24 +705,89 @@ class VSCodeManager(QObject):
                 return None
             
             # Build configuration information
-            config = {
-                'hostname': hostname,
-                'port': port,
-                'user': self.username,
-                'ssh_config': f"""Host {hostname}
+            config = self._make_config(hostname, port)
+
+            logger.info(f"Parsed VSCode configuration information: {config}")
+            self._config_cache[job_id] = (time.monotonic(), config)
+            return config
+        except Exception as e:
+            logger.error(f"Error parsing VSCode configuration information: {str(e)}")
+            return None
+
+    def _get_sftp(self):
+        """Get (or build) the SFTP session on a dedicated connection"""
+        if self._sftp is not None:
+            transport = self._sftp_client.get_transport() if self._sftp_client else None
+            if transport and transport.is_active():
+                return self._sftp
+            self._sftp = None
+
+        self._sftp_client = self._pool.dedicated_client()
+        self._sftp = self._sftp_client.open_sftp()
+        return self._sftp
+
+    def _read_job_output(self, job_id):
+        """
+        Read new bytes of vscode-sshd-<job_id>.out via a cached SFTP handle
+
+        The handle's position persists between polls, so each call only
+        transfers bytes written since the previous read instead of
+        cat-ing the whole file through a forked shell.
+
+        Returns:
+            str: Accumulated file content, or None if the file doesn't exist yet
+        """
+        try:
+            entry = self._sftp_files.get(job_id)
+            if entry is None:
+                sftp = self._get_sftp()
+                handle = sftp.open(f"vscode-sshd-{job_id}.out", 'r')
+                entry = {'file': handle, 'buffer': ''}
+                self._sftp_files[job_id] = entry
+
+            # Cap each transfer: the ssh_config lines sit in the first
+            # few KB, so an unbounded read() of a long-running server's
+            # log would only waste bandwidth. Anything beyond the cap is
+            # picked up from the persisted offset on the next poll.
+            chunk = entry['file'].read(_MAX_COMMAND_OUTPUT)
+            if chunk:
+                entry['buffer'] += chunk.decode('utf-8', errors='replace')
+            if len(entry['buffer']) > _MAX_COMMAND_OUTPUT:
+                # Keep only the newest window; the config regexes match
+                # well before the buffer ever grows this large
+                entry['buffer'] = entry['buffer'][-_MAX_COMMAND_OUTPUT:]
+            return entry['buffer']
+        except IOError:
+            # Output file not created yet
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read output file for job {job_id}: {e}")
+            self._close_job_output(job_id)
+            return None
+
+    def _close_job_output(self, job_id):
+        """Drop the cached SFTP handle for a finished or cancelled job"""
+        entry = self._sftp_files.pop(job_id, None)
+        if entry:
+            try:
+                entry['file'].close()
+            except Exception:
+                pass
+
+    def _make_config(self, hostname, port):
+        """Build the VSCode connection configuration for a parsed host/port"""
+        return {
+            'hostname': hostname,
+            'port': port,
+            'user': self.username,
+            'ssh_config': f"""Host {hostname}
   HostName {hostname}
   Port {port}
   ProxyJump {self.username}@{self.hostname}
   User {self.username}
   UserKnownHostsFile /dev/null
   StrictHostKeyChecking no"""
-            }
-            
-            logger.info(f"Parsed VSCode configuration information: {config}")
-            return config
-        except Exception as e:
-            logger.error(f"Error parsing VSCode configuration information: {str(e)}")
-            return None
+        }
     
     def get_job_status(self, job_id):
         """
@@ -440,39 +801,79 @@ class VSCodeManager(QObject):
         """
         if not job_id:
             return None
-        
+
+        # Serve from the streaming watcher's cache when fresh
+        cached = self._status_cache.get(str(job_id))
+        if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            return dict(cached[1])
+
+        # Collapse bursts of lookups (UI signals, pollers) into one fetch
+        cached = self._status_result_cache.get(job_id)
+        if cached and time.monotonic() - cached[0] < self.STATUS_TTL:
+            return cached[1]
+
+        result = self._fetch_job_status(job_id)
+        self._status_result_cache[job_id] = (time.monotonic(), result)
+        return result
+
+    def _supports_only_job_state(self):
+        """Probe once whether squeue supports --only-job-state (Slurm >= 23.11)"""
+        if self._only_job_state is None:
+            try:
+                help_output = self.execute_ssh_command("squeue --help 2>&1")
+                self._only_job_state = '--only-job-state' in (help_output or "")
+            except Exception:
+                self._only_job_state = False
+            logger.debug(f"squeue --only-job-state supported: {self._only_job_state}")
+        return self._only_job_state
+
+    def _fetch_job_status(self, job_id):
+        """Query squeue (falling back to sacct) for one job's status"""
         try:
-            # Connect SSH
-            if not self.connect_ssh():
-                raise Exception("Unable to connect to SSH server")
-            
+            # While a job is still queued, a state-only query avoids the
+            # scheduler formatting work of the full record; fall through
+            # to the full query once the job is RUNNING (node details
+            # are needed then) or whenever the cheap query fails
+            if self._supports_only_job_state():
+                try:
+                    state = self.execute_ssh_command(
+                        f"squeue --only-job-state -j {job_id} -h -o '%T'")
+                    state = (state or "").strip()
+                    if state and state != 'RUNNING':
+                        return {
+                            'job_id': job_id,
+                            'status': state,
+                            'node': None
+                        }
+                except Exception:
+                    pass
+
             # Execute squeue command to query job
             cmd = f"squeue -j {job_id} -o '%j|%i|%T|%N|%C|%m|%l' -h"
             output = self.execute_ssh_command(cmd)
             
-            # If there is no output, the job may have ended
-            if not output or not output.strip():
+            # If there is no output, the job may have ended (isspace
+            # avoids allocating a stripped copy on every empty poll)
+            if not output or output.isspace():
                 # Query sacct to get information of completed jobs
                 sacct_cmd = f"sacct -j {job_id} -o JobName,JobID,State,NodeList,NCPUS,ReqMem,Timelimit -n -P"
                 sacct_output = self.execute_ssh_command(sacct_cmd)
                 
-                # Parse sacct output
-                if sacct_output and sacct_output.strip():
+                # Parse sacct output; only State and NodeList are used
+                # here, so split just far enough to reach them
+                if sacct_output and not sacct_output.isspace():
                     lines = sacct_output.strip().split('\n')
                     for line in lines:
                         if '.batch' not in line and '.extern' not in line:  # Exclude batch and external steps
-                            parts = line.split('|')
-                            if len(parts) >= 3:
-                                state = parts[2]
-                                node = parts[3] if len(parts) > 3 else ""
-                                
+                            parts = line.split('|', 4)
+                            if len(parts) > 2:
                                 # Return job status
                                 return {
                                     'job_id': job_id,
-                                    'status': state,
-                                    'node': node
+                                    'status': parts[2],
+                                    'node': parts[3] if len(parts) > 3 else ""
                                 }
-                
+
                 # If sacct also has no information, assume the job was cancelled
                 return {
                     'job_id': job_id,
@@ -482,29 +883,25 @@ class VSCodeManager(QObject):
             
             # Parse squeue output
             # Format: JobName|JobId|State|NodeList|NumCPUs|Memory|TimeLimit
-            parts = output.strip().split('|')
-            if len(parts) >= 3:
-                job_name = parts[0]
-                status = parts[2]
-                node = parts[3] if len(parts) > 3 and parts[3] != '(None)' else None
-                cpus = int(parts[4]) if len(parts) > 4 and parts[4].isdigit() else 0
-                
-                # Get and parse memory
-                memory = parts[5] if len(parts) > 5 else "0"
-                
-                # Get time limit
-                time_limit = parts[6] if len(parts) > 6 else ""
-                
+            row = dict(zip(_SQUEUE_FIELDS, output.strip().split('|', 6)))
+            if 'status' in row:
+                if row.get('node') == '(None)':
+                    row['node'] = None
+                try:
+                    cpus = int(row.get('cpus') or 0)
+                except ValueError:
+                    cpus = 0
+
                 # Return job status
                 return {
                     'job_id': job_id,
-                    'status': status,
-                    'node': node,
+                    'status': row['status'],
+                    'node': row.get('node'),
                     'cpus': cpus,
-                    'memory': memory,
-                    'time_limit': time_limit
+                    'memory': row.get('memory', "0"),
+                    'time_limit': row.get('time_limit', "")
                 }
-            
+
             return None
         except Exception as e:
             logger.error(f"Failed to get job status: {e}")
@@ -533,15 +930,20 @@ class VSCodeManager(QObject):
             
             # Always attempt to remove corresponding entry from local SSH config, do not rely on internal tracking state
             self._remove_ssh_config_from_local(job_id)
+            self._close_job_output(job_id)
             
-            # If in tracking set, also remove
-            if job_id in self.config_written_jobs:
-                self.config_written_jobs.remove(job_id)
+            # If tracked as written, also remove
+            self.config_written_jobs.pop(job_id, None)
+
+            # Drop cached state so later lookups see the cancellation
+            self._status_cache.pop(str(job_id), None)
+            self._status_result_cache.pop(job_id, None)
+            self._config_cache.pop(job_id, None)
             
             # Update current job status
             if self.current_job and self.current_job['job_id'] == job_id:
                 self.current_job['status'] = 'CANCELLED'
-                self.vscode_job_status_updated.emit(self.current_job)
+                self._emit_status_update(job_id, self.current_job)
             
             logger.info(f"Job {job_id} cancelled")
             return True
@@ -559,15 +961,20 @@ class VSCodeManager(QObject):
             list: List of job information
         """
         try:
-            cmd = f"squeue -u {self.username} -h -o '%j %i %T %N' | grep vscode-sshd"
+            # Filter server-side with --name instead of piping through grep
+            cmd = f"squeue -u {self.username} --name=vscode-sshd -h -o '%j|%i|%T|%N'"
             output = self.execute_ssh_command(cmd)
-            
+
+            # Fast-reject the common no-jobs case before any split work
+            if not output or output.isspace():
+                return []
+
             jobs = []
             for line in output.strip().split('\n'):
                 if not line.strip():
                     continue
-                
-                parts = line.split()
+
+                parts = line.split('|')
                 if len(parts) >= 4:
                     job_name = parts[0]
                     job_id = parts[1]
@@ -586,76 +993,324 @@ class VSCodeManager(QObject):
             logger.error(f"Error getting VSCode jobs: {str(e)}")
             return []
     
-    def __del__(self):
-        """Destructor to ensure SSH connection is closed"""
-        if hasattr(self, '_ssh_client') and self._ssh_client:
+    # Polling backoff: back off while a job waits in the queue, poll
+    # quickly once it transitions to RUNNING
+    POLL_MIN_INTERVAL = 2
+    POLL_MAX_INTERVAL = 30
+    POLL_DEADLINE = 15 * 60
+    # How long watcher-fed status entries stay fresh (watcher emits every 10s)
+    STATUS_CACHE_TTL = 15
+    # TTLs of the per-call result caches; the .out file rarely changes
+    # once produced, so parsed configs stay fresh much longer
+    STATUS_TTL = 3
+    CONFIG_TTL = 30
+
+    def _start_squeue_watcher(self):
+        """Start the streaming squeue watcher thread if not already running"""
+        if self._watcher_thread is not None and self._watcher_thread.is_alive():
+            return
+        self._watcher_thread = threading.Thread(
+            target=self._squeue_watcher,
+            daemon=True,
+            name="squeue-watcher"
+        )
+        self._watcher_thread.start()
+
+    def _squeue_watcher(self):
+        """
+        Keep one long-lived `squeue -i` stream open and mirror its rows
+        into the status cache
+
+        One server-side repeating query replaces a fresh squeue RPC per
+        get_job_status call; the stream is restarted with backoff on EOF.
+        """
+        backoff = 2
+        while True:
+            client = None
             try:
-                self._ssh_client.close()
+                client = self._pool.dedicated_client()
+                chan = client.get_transport().open_session()
+                chan.set_combine_stderr(True)
+                chan.exec_command("squeue --me -i 10 -h -o '%i|%T|%N'")
+                for line in chan.makefile('r'):
+                    parts = line.strip().split('|')
+                    if len(parts) >= 2 and parts[0]:
+                        node = parts[2] if len(parts) > 2 and parts[2] != '(None)' else None
+                        self._status_cache[parts[0]] = (time.monotonic(), {
+                            'job_id': parts[0],
+                            'status': parts[1],
+                            'node': node
+                        })
+                    backoff = 2
             except Exception as e:
-                logging.error(f"Failed to close SSH connection: {str(e)}")
-    
+                logger.debug(f"[VSCodeManager] squeue watcher interrupted: {e}")
+            finally:
+                if client:
+                    try:
+                        client.close()
+                    except Exception:
+                        pass
+
+            if not self._tracked_jobs:
+                # No jobs left to watch; stop streaming until tracking resumes
+                self._watcher_thread = None
+                return
+
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
     def _start_poll_job_status(self, job_id):
         """
-        Start a thread to poll job status
-        
+        Register a job with the central poller, starting it if needed
+
         Args:
             job_id: Job ID
         """
-        def poll_job():
-            """Thread function to poll job status"""
-            try:
-                # Initialize poll count
-                poll_count = 0
-                
-                # Continuously poll until job completes or times out
-                while True:
-                    # Get job status
-                    job_status = self.get_job_status(job_id)
-                    
-                    if not job_status or job_status.get('status') in ['COMPLETED', 'FAILED', 'CANCELLED', 'TIMEOUT']:
-                        # Job has ended
-                        logger.info(f"Job {job_id} has ended, status: {job_status.get('status') if job_status else 'UNKNOWN'}")
-                        break
-                    elif job_status.get('status') == 'RUNNING':
-                        # Job is running, attempt to get configuration
-                        if poll_count % 2 == 0:  # Check configuration every few polls
-                            config = self._parse_vscode_config(job_id)
+        loop = self._ensure_loop()
+        self._tracked_jobs[job_id] = {
+            'job_id': job_id,
+            'status': 'PENDING',
+            'poll_count': 0,
+            'interval': self.poll_interval_min,
+            'next_check': 0,
+            'deadline': time.monotonic() + self.POLL_DEADLINE,
+            'streaming': False
+        }
+        self._start_squeue_watcher()
+        if self._poller_task is None or self._poller_task.done():
+            self._poller_task = asyncio.run_coroutine_threadsafe(
+                self._central_poller(), loop)
+
+    async def _central_poller(self):
+        """
+        Poll all tracked jobs with a single batched squeue per tick
+
+        One squeue round trip covers every tracked job instead of one SSH
+        command per job per tick; jobs missing from squeue are resolved
+        with one batched sacct call. Per-job intervals back off
+        exponentially while a job is queued and snap back once it runs.
+        """
+        try:
+            while self._tracked_jobs:
+                now = time.monotonic()
+                due = [job_id for job_id, tracked in self._tracked_jobs.items()
+                       if tracked['next_check'] <= now]
+                if not due:
+                    await asyncio.sleep(1)
+                    continue
+
+                ids = ",".join(due)
+                rows = {}
+                missing = set(due)
+                try:
+                    cmd = f"squeue -j {ids} -h -o '%i|%T|%N|%C|%m|%l'"
+                    output = await self._run_blocking(self.execute_ssh_command, cmd)
+                    for line in output.strip().split('\n'):
+                        parts = line.strip().split('|')
+                        if len(parts) >= 2 and parts[0] in self._tracked_jobs:
+                            node = parts[2] if len(parts) > 2 and parts[2] != '(None)' else None
+                            rows[parts[0]] = {
+                                'job_id': parts[0],
+                                'status': parts[1],
+                                'node': node,
+                                'cpus': int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 0,
+                                'memory': parts[4] if len(parts) > 4 else "0",
+                                'time_limit': parts[5] if len(parts) > 5 else ""
+                            }
+                except Exception as e:
+                    logger.error(f"Central poll squeue failed: {e}")
+
+                missing -= rows.keys()
+
+                # Resolve jobs that fell out of squeue via one batched sacct
+                if missing:
+                    try:
+                        sacct_cmd = (f"sacct -j {','.join(missing)} "
+                                     "-o JobID,State,NodeList -n -P")
+                        sacct_output = await self._run_blocking(self.execute_ssh_command, sacct_cmd)
+                        for line in sacct_output.strip().split('\n'):
+                            if '.batch' in line or '.extern' in line:
+                                continue
+                            parts = line.split('|')
+                            if len(parts) >= 2 and parts[0] in missing:
+                                rows[parts[0]] = {
+                                    'job_id': parts[0],
+                                    'status': parts[1].split()[0] if parts[1] else 'CANCELLED',
+                                    'node': parts[2] if len(parts) > 2 else None
+                                }
+                    except Exception as e:
+                        logger.error(f"Central poll sacct failed: {e}")
+
+                for job_id in due:
+                    tracked = self._tracked_jobs.get(job_id)
+                    if tracked is None:
+                        continue
+                    job_status = rows.get(job_id)
+                    if not job_status:
+                        job_status = {'job_id': job_id, 'status': 'CANCELLED', 'node': None}
+
+                    status = job_status.get('status')
+                    self._sync_current_job(job_id, job_status=job_status)
+                    if status in ['COMPLETED', 'FAILED', 'CANCELLED', 'TIMEOUT']:
+                        logger.info(f"Job {job_id} has ended, status: {status}")
+                        self._emit_status_update(job_id, job_status)
+                        self._close_job_output(job_id)
+                        self._last_emitted_status.pop(job_id, None)
+                        del self._tracked_jobs[job_id]
+                        continue
+
+                    changed = status != tracked.get('status')
+                    tracked['status'] = status
+
+                    if status == 'RUNNING':
+                        # Snap back to fast polling once the job runs
+                        tracked['interval'] = self.poll_interval_min
+
+                        if job_id not in self.config_written_jobs and not tracked['streaming']:
+                            # Follow the output file so the config is caught
+                            # the moment it is written, not on the next tick
+                            tracked['streaming'] = True
+                            asyncio.ensure_future(self._stream_vscode_config(job_id))
+                        elif (not tracked['streaming']
+                              and job_id not in self.config_written_jobs
+                              and tracked['poll_count'] % 2 == 0):
+                            # Fallback: re-parse the output file periodically
+                            # until the config has been captured once
+                            config = await self._run_blocking(self._parse_vscode_config, job_id)
                             if config:
                                 # Update job information
                                 job_status['config'] = config
-                                
+                                self._sync_current_job(job_id, config=config)
+
                                 # Write configuration to local SSH config (if not already written)
                                 hostname = config.get('hostname')
-                                if hostname and job_id not in self.config_written_jobs:
-                                    # Use signal to transfer operation to main thread
+                                if hostname and self._claim_config_write(job_id):
                                     self._add_ssh_config_to_local(job_id, config)
                                     # Emit signal to notify configuration added
                                     self.ssh_config_added.emit(job_id, hostname)
-                                    # Mark configuration as written
-                                    self.config_written_jobs.add(job_id)
                                     logger.info(f"SSH configuration for job {job_id} written (first time)")
-                                
+
                                 # Emit configuration ready signal
                                 self.vscode_config_ready.emit(job_status)
-                    
-                    # Emit status update signal
-                    self.vscode_job_status_updated.emit(job_status)
-                    
-                    # Increment poll count
-                    poll_count += 1
-                    
-                    # Delay
-                    time.sleep(5)  # Poll every 5 seconds
-                    
-                    # Exit if polling exceeds a certain count
-                    if poll_count > 180:  # Exit after 15 minutes
+                    else:
+                        # Back off exponentially while the state is stable,
+                        # reset to the floor whenever it changes
+                        tracked['interval'] = self._next_delay(
+                            tracked['interval'], changed)
+
+                    # Emit status update signal (coalesced on no change)
+                    self._emit_status_update(job_id, job_status)
+
+                    tracked['poll_count'] += 1
+                    tracked['next_check'] = time.monotonic() + tracked['interval']
+                    if time.monotonic() > tracked['deadline']:
                         logger.warning(f"Polling job {job_id} status timed out")
+                        self._last_emitted_status.pop(job_id, None)
+                        del self._tracked_jobs[job_id]
+
+                await asyncio.sleep(1)
+        except Exception as e:
+            logger.error(f"Failed to poll job status: {e}")
+
+    async def _stream_vscode_config(self, job_id):
+        """
+        Follow the job output file and capture the VSCode configuration
+        as soon as it appears, instead of re-reading the file every tick
+        """
+        try:
+            config = await self._run_blocking(self._tail_config_output, job_id)
+        except Exception as e:
+            logger.error(f"Streaming configuration for job {job_id} failed: {e}")
+            config = None
+
+        tracked = self._tracked_jobs.get(job_id)
+        if tracked is not None:
+            # On failure the poller falls back to periodic re-parsing
+            tracked['streaming'] = False
+
+        if not config:
+            return
+
+        self._sync_current_job(job_id, config=config)
+        hostname = config.get('hostname')
+        if hostname and self._claim_config_write(job_id):
+            self._add_ssh_config_to_local(job_id, config)
+            self.ssh_config_added.emit(job_id, hostname)
+            logger.info(f"SSH configuration for job {job_id} written (first time)")
+
+        job_status = {'job_id': job_id, 'status': 'RUNNING', 'config': config}
+        self.vscode_config_ready.emit(job_status)
+
+    def _tail_config_output(self, job_id, timeout=120):
+        """
+        Run tail -F on vscode-sshd-<job_id>.out over a dedicated channel
+        and return the parsed configuration once hostname and port appear
+        """
+        with self._pool.borrow() as client:
+            chan = client.get_transport().open_session()
+            try:
+                chan.settimeout(5)
+                chan.exec_command(f"tail -F -n +1 vscode-sshd-{job_id}.out 2>/dev/null")
+                buf = ""
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    try:
+                        data = chan.recv(4096)
+                    except Exception:
+                        continue
+                    if not data:
                         break
-            except Exception as e:
-                logger.error(f"Failed to poll job status: {e}")
-        
-        # Start thread
-        threading.Thread(target=poll_job, daemon=True).start()
+                    buf += data.decode('utf-8', errors='replace')
+                    hostname_match = _RE_HOSTNAME.search(buf)
+                    port_match = _RE_PORT.search(buf)
+                    if hostname_match and port_match:
+                        return self._make_config(
+                            hostname_match.group(1), port_match.group(1))
+            finally:
+                chan.close()
+        return None
+
+    def _read_local_ssh_config(self, config_file):
+        """
+        Return the text of the local SSH config file, served from an
+        in-memory cache that is invalidated when the file's mtime changes
+
+        Args:
+            config_file: Path to ~/.ssh/config
+
+        Returns:
+            str: File contents, or empty string if the file does not exist
+        """
+        try:
+            mtime = os.stat(config_file).st_mtime_ns
+        except OSError:
+            self._ssh_config_text = None
+            self._ssh_config_mtime = None
+            return ""
+        if self._ssh_config_text is not None and self._ssh_config_mtime == mtime:
+            return self._ssh_config_text
+        with open(config_file, 'r') as f:
+            text = f.read()
+        self._ssh_config_text = text
+        self._ssh_config_mtime = mtime
+        return text
+
+    def _write_local_ssh_config(self, config_file, text):
+        """
+        Atomically replace the local SSH config file and refresh the
+        in-memory cache
+
+        Args:
+            config_file: Path to ~/.ssh/config
+            text: Full new file contents
+        """
+        tmp_file = config_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(text)
+        os.chmod(tmp_file, 0o600)
+        os.replace(tmp_file, config_file)
+        self._ssh_config_text = text
+        self._ssh_config_mtime = os.stat(config_file).st_mtime_ns
 
     def _add_ssh_config_to_local(self, job_id, config):
         """
@@ -674,30 +1329,15 @@ class VSCodeManager(QObject):
             # Configuration file path
             config_file = os.path.join(ssh_dir, "config")
             
-            # Read existing configuration
-            existing_config = ""
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    existing_config = f.read()
-            
+            # Read existing configuration (cached in memory)
+            existing_config = self._read_local_ssh_config(config_file)
+
             # Configuration to add (with marked comments for later removal)
             hostname = config.get('hostname')
             
-            # Find corresponding SSH key file path
-            identity_file = self.key_path
-            if not identity_file:
-                # If no key path specified, try to get from user information
-                from modules.auth import get_all_existing_users
-                users = get_all_existing_users()
-                for user in users:
-                    if user['username'] == self.username:
-                        identity_file = user['key_path']
-                        break
-            
-            # If still no key path found, use default path
-            if not identity_file:
-                identity_file = os.path.expanduser(f"~/.ssh/{self.username}_hpc_app_key")
-            
+            # SSH key file path resolved once at init
+            identity_file = self._resolved_identity_file
+
             # Construct jump host name (unique identifier)
             jump_host = f"hpc_login_{job_id}"
             
@@ -721,18 +1361,36 @@ Host {hostname}
 # === END HPC App VSCode Configuration (JobID: {job_id}) ===
 """
             
-            # Check if configuration for the same host already exists
-            pattern = re.compile(r'# === BEGIN HPC App VSCode Configuration \(JobID: .*?\) ===.*?# === END HPC App VSCode Configuration \(JobID: .*?\) ===', re.DOTALL)
-            
-            # If configuration added by HPC App already exists, remove it first
-            existing_config = pattern.sub('', existing_config)
-            
-            # Add new configuration to the end of the file
-            with open(config_file, 'w') as f:
+            if new_config in existing_config:
+                # Identical block already on disk (e.g. left over from a
+                # previous app run) - nothing to write
+                logger.debug(f"SSH configuration for job {job_id} already present, skipping write")
+                return
+
+            if ("# === BEGIN HPC App" not in existing_config
+                    or _RE_HPC_BLOCK.search(existing_config) is None):
+                # No prior HPC block: just append the new block instead of
+                # rewriting the whole file
+                with open(config_file, 'a') as f:
+                    f.write(new_config)
+                self._ssh_config_text = existing_config + new_config
+                self._ssh_config_mtime = os.stat(config_file).st_mtime_ns
+            else:
+                # A stale block for this job may exist: strip only this
+                # job's block (blocks for other jobs stay untouched) and
+                # rewrite. Build the full content in memory and swap it in
+                # atomically so a crash mid-write can't truncate the
+                # user's SSH config
+                existing_config = _RE_HPC_BLOCK.sub(
+                    lambda m: '' if m.group(1) == str(job_id) else m.group(0),
+                    existing_config
+                )
+                buf = []
                 if existing_config.strip():
-                    f.write(existing_config.rstrip() + "\n")
-                f.write(new_config)
-            
+                    buf.append(existing_config.rstrip() + "\n")
+                buf.append(new_config)
+                self._write_local_ssh_config(config_file, "".join(buf))
+
             # Set correct permissions
             os.chmod(config_file, 0o600)
             
@@ -758,22 +1416,28 @@ Host {hostname}
                 logger.warning(f"SSH configuration file does not exist: {config_file}")
                 return
             
-            # Read existing configuration
-            with open(config_file, 'r') as f:
-                existing_config = f.read()
-            
-            # Use regex to match and remove specified job's configuration
-            pattern = re.compile(rf'# === BEGIN HPC App VSCode Configuration \(JobID: {job_id}\) ===.*?# === END HPC App VSCode Configuration \(JobID: {job_id}\) ===', re.DOTALL)
-            
-            # Check if matching configuration exists
-            match = pattern.search(existing_config)
-            if match:
-                # Replace matched part with empty string
-                new_config = pattern.sub('', existing_config)
-                
-                # Write back to file
-                with open(config_file, 'w') as f:
-                    f.write(new_config)
+            # Read existing configuration (cached in memory)
+            existing_config = self._read_local_ssh_config(config_file)
+
+            # Cheap substring probe before running the DOTALL regex; on
+            # startup cleanup the block is usually absent
+            if f"JobID: {job_id})" not in existing_config:
+                logger.info(f"SSH configuration for job {job_id} not found in {config_file}, no removal needed")
+                return
+
+            # Remove only the block belonging to this job; the shared pattern
+            # captures each block's job ID, so no per-job recompilation
+            removed = False
+            new_config = _RE_HPC_BLOCK.sub(
+                lambda m: '' if m.group(1) == str(job_id) else m.group(0),
+                existing_config)
+            if new_config != existing_config:
+                removed = True
+
+            if removed:
+                # Write back atomically so a crash mid-write can't
+                # truncate the user's SSH config
+                self._write_local_ssh_config(config_file, new_config)
                 logger.info(f"SSH configuration for job {job_id} removed from {config_file}")
                 
                 # Emit signal to notify configuration removed
@@ -1,22 +1,184 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                           QTableWidget, QTableWidgetItem, QHeaderView, QStyle, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                           QTableView, QHeaderView, QStyle,
                            QFrame, QSplitter, QGridLayout, QProgressBar)
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import (Qt, pyqtSlot, QAbstractTableModel, QModelIndex,
+                        QSortFilterProxyModel)
 from PyQt5.QtGui import QFont, QColor, QBrush
 
 import logging
-from modules.balance import BalanceManager
-from modules.auth import HPC_SERVER, get_all_existing_users
+import time
+from operator import itemgetter
+
+# modules.balance (and through it paramiko) and modules.auth are
+# imported lazily in the functions that need them, so merely importing
+# this widget doesn't pay the SSH-stack import cost
 
 # Configure logging
 logger = logging.getLogger('BalanceWidget')
 
+# Shared paint resources: data() runs for every visible cell on every
+# repaint, so brushes and fonts are built once instead of per call
+_BRUSH_RED = QBrush(QColor(255, 0, 0))
+_BRUSH_ORANGE = QBrush(QColor(255, 165, 0))
+_BRUSH_GREEN = QBrush(QColor(0, 128, 0))
+_BRUSH_BLUE = QBrush(QColor(0, 0, 255))
+_FONT_BOLD = QFont()
+_FONT_BOLD.setBold(True)
+
+# Lazily built username -> user record map so repeated widget
+# construction doesn't rescan ~/.ssh for every known user
+_users_by_name = None
+
+def _get_user_record(username):
+    """Look up a stored user record by username, caching the scan"""
+    global _users_by_name
+    if _users_by_name is None:
+        from modules.auth import get_all_existing_users
+        _users_by_name = {u['username']: u for u in get_all_existing_users()}
+    return _users_by_name.get(username)
+
+def invalidate_users_cache():
+    """Drop the cached user map (call after users are added or removed)"""
+    global _users_by_name
+    _users_by_name = None
+
+class AccountsModel(QAbstractTableModel):
+    """
+    Table model backing the accounts view
+
+    Holds the sorted accounts list plus pre-formatted display strings
+    and usage ratios computed once per refresh, so the view only pulls
+    cheap lookups for the cells it actually paints - no per-row item
+    widgets are created.
+    """
+
+    HEADERS = ["Account Name", "Personal Usage", "Total Account Usage",
+               "Account Limit", "Available"]
+
+    # Raw values for numeric sorting via the proxy's sort role
+    RawSortRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accounts = []
+        self._display = []
+        self._ratios = []
+
+    def set_accounts(self, accounts):
+        """Replace the model contents with a new sorted accounts list"""
+        display = [
+            (a['name'],
+             f"{a['user_usage']:,}",
+             f"{a['account_usage']:,}",
+             f"{a['account_limit']:,}",
+             f"{a['available']:,}")
+            for a in accounts
+        ]
+        ratios = [
+            (a['account_usage'] / a['account_limit'] * 100) if a['account_limit'] > 0 else 0
+            for a in accounts
+        ]
+
+        # Same accounts in the same order (the common refresh case):
+        # update values in place and signal only the rows that changed,
+        # instead of a full reset that drops selection and scroll state
+        if (len(accounts) == len(self._accounts)
+                and all(a['name'] == b['name']
+                        for a, b in zip(accounts, self._accounts))):
+            old_display = self._display
+            self._accounts = accounts
+            self._ratios = ratios
+            self._display = display
+            last_col = len(self.HEADERS) - 1
+            for row in range(len(accounts)):
+                if display[row] != old_display[row]:
+                    self.dataChanged.emit(self.index(row, 0),
+                                          self.index(row, last_col))
+            return
+
+        self.beginResetModel()
+        self._accounts = accounts
+        self._display = display
+        self._ratios = ratios
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        account = self._accounts[row]
+
+        if role == Qt.DisplayRole:
+            return self._display[row][col]
+
+        if role == self.RawSortRole:
+            if col == 0:
+                return account['name']
+            key = ('user_usage', 'account_usage', 'account_limit', 'available')[col - 1]
+            return account[key]
+
+        if col == 0 and account['is_personal']:
+            # Personal accounts are bold and blue
+            if role == Qt.FontRole:
+                return _FONT_BOLD
+            if role == Qt.ForegroundRole:
+                return _BRUSH_BLUE
+
+        if col == 4 and role == Qt.ForegroundRole:
+            # Color availability by how close the account is to its limit
+            usage_ratio = self._ratios[row]
+            if usage_ratio > 90:
+                return _BRUSH_RED
+            elif usage_ratio > 70:
+                return _BRUSH_ORANGE
+            return _BRUSH_GREEN
+
+        return None
+
 class BalanceWidget(QWidget):
     """Account available computing balance widget, displays user's computing resource usage and balance"""
-    
+
+    # Progress-bar stylesheets by usage bucket (green/orange/red); parsed
+    # by Qt only when the bucket actually changes
+    _BAR_STYLESHEETS = (
+        """
+        QProgressBar::chunk { background-color: green; }
+        QProgressBar { text-align: center; }
+        """,
+        """
+        QProgressBar::chunk { background-color: orange; }
+        QProgressBar { text-align: center; }
+        """,
+        """
+        QProgressBar::chunk { background-color: red; }
+        QProgressBar { text-align: center; }
+        """,
+    )
+
+    # Minimum seconds between refresh requests to the HPC backend
+    MIN_REFRESH_INTERVAL = 2.0
+
+    # Refresh-indicator stylesheets by state; applied only on transitions
+    _INDICATOR_STYLES = {
+        'ready': "color: green;",
+        'busy': "color: orange;",
+        'error': "color: red;",
+    }
+
     def __init__(self, parent=None, username=None):
         super().__init__(parent)
         
@@ -26,7 +188,24 @@ class BalanceWidget(QWidget):
         
         # Account data
         self.balance_data = None
-        
+
+        # Last applied progress-bar color bucket (index into
+        # _BAR_STYLESHEETS), None until the first refresh
+        self._last_bar_bucket = None
+
+        # Refresh throttling: one in-flight request at a time, with a
+        # minimum interval so rapid clicks can't pile up SSH queries
+        self._refresh_in_flight = False
+        self._last_refresh_ts = 0.0
+
+        # Signature of the last rendered payload; polling usually
+        # returns identical data, so identical payloads skip the UI work
+        self._last_sig = None
+
+        # Current refresh-indicator state ('ready'/'busy'/'error');
+        # init_ui applies the initial ready style
+        self._indicator_state = 'ready'
+
         # Initialize balance manager
         self.init_balance_manager()
         
@@ -42,19 +221,17 @@ class BalanceWidget(QWidget):
         if not self.username:
             return
         
-        # Get SSH key path
-        users = get_all_existing_users()
-        key_path = None
-        
-        for user in users:
-            if user['username'] == self.username:
-                key_path = user['key_path']
-                break
-        
+        # Get SSH key path (O(1) lookup against the cached user map)
+        user = _get_user_record(self.username)
+        key_path = user['key_path'] if user else None
+
         if not key_path:
             return
-        
-        # Create balance manager
+
+        # Create balance manager (deferred import keeps paramiko out of
+        # module import time)
+        from modules.balance import BalanceManager
+        from modules.auth import HPC_SERVER
         self.balance_manager = BalanceManager(
             hostname=HPC_SERVER,
             username=self.username,
@@ -119,14 +296,16 @@ class BalanceWidget(QWidget):
         overview_layout.addLayout(username_layout, 0, 0)
         overview_layout.addLayout(resource_layout, 1, 0)
         
-        # Accounts table
-        self.accounts_table = QTableWidget()
-        self.accounts_table.setColumnCount(5)
-        self.accounts_table.setHorizontalHeaderLabels([
-            "Account Name", "Personal Usage", "Total Account Usage", "Account Limit", "Available"
-        ])
+        # Accounts table: view over AccountsModel, sorted through a proxy
+        self.accounts_model = AccountsModel(self)
+        self.accounts_proxy = QSortFilterProxyModel(self)
+        self.accounts_proxy.setSourceModel(self.accounts_model)
+        self.accounts_proxy.setSortRole(AccountsModel.RawSortRole)
+
+        self.accounts_table = QTableView()
+        self.accounts_table.setModel(self.accounts_proxy)
         self.accounts_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.accounts_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.accounts_table.setEditTriggers(QTableView.NoEditTriggers)
         self.accounts_table.setSortingEnabled(True)
         
         # Create splitter, place overview at the top and details at the bottom
@@ -149,33 +328,73 @@ class BalanceWidget(QWidget):
         # Add status bar to main layout
         main_layout.addLayout(status_layout)
     
+    def _set_indicator(self, state, text):
+        """Update the refresh indicator, restyling only on state changes"""
+        if text != self.refresh_indicator.text():
+            self.refresh_indicator.setText(text)
+        if state != self._indicator_state:
+            self._indicator_state = state
+            self.refresh_indicator.setStyleSheet(self._INDICATOR_STYLES[state])
+
     @pyqtSlot()
     def refresh_balance(self):
         """Refresh balance information"""
         if not self.balance_manager:
             self.show_error("Balance manager not set, unable to retrieve data")
             return
-        
+
+        # Coalesce: ignore the request if one is already in flight or
+        # the last one completed moments ago
+        if self._refresh_in_flight:
+            return
+        if time.monotonic() - self._last_refresh_ts < self.MIN_REFRESH_INTERVAL:
+            return
+        self._refresh_in_flight = True
+
         # Update UI state
         self.refresh_btn.setEnabled(False)
-        self.refresh_indicator.setText("Refreshing...")
-        self.refresh_indicator.setStyleSheet("color: orange;")
-        
+        self._set_indicator('busy', "Refreshing...")
+
         # Get balance information
         self.balance_manager.refresh_balance()
     
     @pyqtSlot(dict)
     def update_balance_data(self, balance_data):
         """Update balance data"""
+        # Unchanged payload (the common polling case): just restore the
+        # button/indicator state, skip the table and progress-bar work
+        new_sig = hash((
+            balance_data['total_usage'],
+            balance_data['total_available'],
+            tuple((a['name'], a['user_usage'], a['account_usage'],
+                   a['account_limit'], a['available'])
+                  for a in balance_data['accounts'])
+        ))
+        if new_sig == self._last_sig:
+            self._refresh_in_flight = False
+            self._last_refresh_ts = time.monotonic()
+            self.refresh_btn.setEnabled(True)
+            self._set_indicator('ready', "Ready")
+            return
+        self._last_sig = new_sig
+
+        # Attach the display sort key once per payload; sorted() then
+        # reads a plain tuple field instead of invoking a lambda and
+        # two dict lookups per comparison
+        for account in balance_data['accounts']:
+            account['_sort_key'] = (0 if account['is_personal'] else 1,
+                                    account['name'])
+
         self.balance_data = balance_data
-        
+
         # Update UI
         self.update_ui()
         
         # Restore UI state
+        self._refresh_in_flight = False
+        self._last_refresh_ts = time.monotonic()
         self.refresh_btn.setEnabled(True)
-        self.refresh_indicator.setText("Ready")
-        self.refresh_indicator.setStyleSheet("color: green;")
+        self._set_indicator('ready', "Ready")
     
     def update_ui(self):
         """Update UI display"""
@@ -202,87 +421,36 @@ class BalanceWidget(QWidget):
     
     def update_accounts_table(self):
         """Update accounts table"""
-        # Disable sorting to prevent confusion during reload
-        self.accounts_table.setSortingEnabled(False)
-        self.accounts_table.setRowCount(0)
-        
         if not self.balance_data or not self.balance_data['accounts']:
+            self.accounts_model.set_accounts([])
             return
-        
-        # Sort by account type: personal accounts first, shared accounts later
+
+        # Sort by account type: personal accounts first, shared accounts
+        # later (key precomputed in update_balance_data)
         sorted_accounts = sorted(
-            self.balance_data['accounts'], 
-            key=lambda x: (0 if x['is_personal'] else 1, x['name'])
+            self.balance_data['accounts'],
+            key=itemgetter('_sort_key')
         )
-        
-        # Add a row for each account
-        for row, account in enumerate(sorted_accounts):
-            self.accounts_table.insertRow(row)
-            
-            # Account name
-            name_item = QTableWidgetItem(account['name'])
-            # Personal accounts are bold
-            if account['is_personal']:
-                font = name_item.font()
-                font.setBold(True)
-                name_item.setFont(font)
-                name_item.setForeground(QBrush(QColor(0, 0, 255)))  # Personal accounts in blue
-            self.accounts_table.setItem(row, 0, name_item)
-            
-            # Personal usage
-            user_usage_item = QTableWidgetItem(f"{account['user_usage']:,}")
-            self.accounts_table.setItem(row, 1, user_usage_item)
-            
-            # Total account usage
-            account_usage_item = QTableWidgetItem(f"{account['account_usage']:,}")
-            self.accounts_table.setItem(row, 2, account_usage_item)
-            
-            # Account limit
-            account_limit_item = QTableWidgetItem(f"{account['account_limit']:,}")
-            self.accounts_table.setItem(row, 3, account_limit_item)
-            
-            # Available
-            available_item = QTableWidgetItem(f"{account['available']:,}")
-            # Set color based on availability
-            usage_ratio = (account['account_usage'] / account['account_limit'] * 100) if account['account_limit'] > 0 else 0
-            self.set_item_color_by_usage(available_item, usage_ratio)
-            self.accounts_table.setItem(row, 4, available_item)
-        
-        # Restore sorting
-        self.accounts_table.setSortingEnabled(True)
+
+        # One model reset replaces per-row item construction; the view
+        # re-queries only the visible cells
+        self.accounts_model.set_accounts(sorted_accounts)
     
     def set_progress_bar_color(self, usage_ratio):
         """Set progress bar color based on usage rate"""
-        if usage_ratio > 90:
-            self.resource_progress.setStyleSheet("""
-                QProgressBar::chunk { background-color: red; }
-                QProgressBar { text-align: center; }
-            """)
-        elif usage_ratio > 70:
-            self.resource_progress.setStyleSheet("""
-                QProgressBar::chunk { background-color: orange; }
-                QProgressBar { text-align: center; }
-            """)
-        else:
-            self.resource_progress.setStyleSheet("""
-                QProgressBar::chunk { background-color: green; }
-                QProgressBar { text-align: center; }
-            """)
-    
-    def set_item_color_by_usage(self, item, usage_ratio):
-        """Set table item color based on usage rate"""
-        if usage_ratio > 90:
-            item.setForeground(QBrush(QColor(255, 0, 0)))  # Red
-        elif usage_ratio > 70:
-            item.setForeground(QBrush(QColor(255, 165, 0)))  # Orange
-        else:
-            item.setForeground(QBrush(QColor(0, 128, 0)))  # Green
+        bucket = 2 if usage_ratio > 90 else 1 if usage_ratio > 70 else 0
+        if bucket == self._last_bar_bucket:
+            # Same color as last refresh: skip the stylesheet re-parse
+            return
+        self._last_bar_bucket = bucket
+        self.resource_progress.setStyleSheet(self._BAR_STYLESHEETS[bucket])
     
     def show_error(self, error_msg):
         """Display error message"""
-        self.refresh_indicator.setText(f"Error: {error_msg}")
-        self.refresh_indicator.setStyleSheet("color: red;")
+        self._set_indicator('error', f"Error: {error_msg}")
         logger.error(error_msg)
-        
+
         # Enable refresh button
-        self.refresh_btn.setEnabled(True) 
\ No newline at end of file
+        self._refresh_in_flight = False
+        self._last_refresh_ts = time.monotonic()
+        self.refresh_btn.setEnabled(True)
\ No newline at end of file
@@ -1,47 +1,171 @@
-from PyQt5.QtWidgets import (QDialog, QLineEdit, QPushButton, QFormLayout, QMessageBox, 
-                            QInputDialog, QProgressDialog, QApplication, QVBoxLayout, QHBoxLayout, 
-                            QListWidget, QLabel, QFrame, QGroupBox, QGridLayout, QComboBox, 
+from PyQt5.QtWidgets import (QDialog, QLineEdit, QPushButton, QFormLayout, QMessageBox,
+                            QProgressDialog, QVBoxLayout, QHBoxLayout,
+                            QListWidget, QLabel, QGroupBox, QGridLayout,
                             QListWidgetItem)
 import logging
-import os
-import subprocess
 import time
-import pexpect
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QIcon, QFont
-from modules.auth import HPC_SERVER, APP_MARKER, get_all_existing_users, delete_user_key
-from modules.auth import check_and_login_with_key, get_node_info_via_key
-from modules.ssh_key_uploader import generate_and_upload_ssh_key
+from PyQt5.QtCore import (QTimer, Qt, QObject, QThread, QRunnable, QThreadPool,
+                          pyqtSignal, pyqtSlot)
 
-# Global variable to store the last successful login node information
-LAST_NODE_INFO = None
+# modules.auth and modules.ssh_key_uploader (which pull in paramiko)
+# are imported inside the functions that use them, keeping dialog
+# import time free of the SSH stack
 
-def get_last_node_info():
-    """Get the last successful login node information"""
-    return LAST_NODE_INFO
+class LoginWorker(QObject):
+    """
+    Runs the blocking SSH/key operations on a worker thread
+
+    The dialog emits request signals into this object (queued across
+    the thread boundary) and receives the results via the done signals,
+    so the Qt event loop never blocks on a network round-trip.
+    """
+
+    # success, username, node_info, error message
+    key_login_done = pyqtSignal(bool, object, object, object)
+    # success, node_info
+    new_user_login_done = pyqtSignal(bool, object)
+    # success, node_info (key-effect probe after upload)
+    key_probe_done = pyqtSignal(bool, object)
+    # progress text for the dialog's status label
+    status_update = pyqtSignal(str)
+
+    @pyqtSlot(str)
+    def do_key_login(self, username):
+        """Attempt key-based login and fetch node info"""
+        from modules.auth import check_and_login_with_key, get_node_info_via_key
+        try:
+            success, logged_in_user, message = check_and_login_with_key(username)
+            if success:
+                node_info = get_node_info_via_key(logged_in_user)
+                self.key_login_done.emit(True, logged_in_user, node_info, message)
+            else:
+                self.key_login_done.emit(False, None, None, message)
+        except Exception as e:
+            self.key_login_done.emit(False, None, None, str(e))
+
+    @pyqtSlot(str, str)
+    def do_new_user_login(self, uc_id, password):
+        """Generate/upload the SSH key for a new user and fetch node info"""
+        from modules.auth import HPC_SERVER, get_node_info_via_key
+        from modules.ssh_key_uploader import generate_and_upload_ssh_key
+        # A busy head node can fail a single upload on a one-off prompt
+        # race; retry with exponential backoff before giving up so the
+        # user doesn't have to re-type their password
+        result, node_info = False, None
+        for attempt in range(3):
+            if attempt:
+                self.status_update.emit(f"Retrying... ({attempt + 1}/3)")
+                time.sleep(1 << attempt)
+            try:
+                result, node_info = generate_and_upload_ssh_key(
+                    username=uc_id,
+                    password=password,
+                    host=HPC_SERVER,
+                    force=True
+                )
+            except Exception as e:
+                logging.error(f"Error during new user login (attempt {attempt + 1}/3): {e}")
+                result, node_info = False, None
+            if result:
+                break
+
+        if result:
+            # Node info comes back on the upload session itself;
+            # a second SSH connection is only needed if it didn't
+            if node_info is None:
+                node_info = get_node_info_via_key(uc_id)
+            self.new_user_login_done.emit(True, node_info)
+        else:
+            self.new_user_login_done.emit(False, None)
+
+    @pyqtSlot(str)
+    def do_key_probe(self, username):
+        """Probe whether the freshly uploaded key is usable yet"""
+        from modules.auth import get_node_info_via_key
+        try:
+            node_info = get_node_info_via_key(username)
+            self.key_probe_done.emit(node_info is not None, node_info)
+        except Exception:
+            self.key_probe_done.emit(False, None)
+
+class _UserListLoader(QRunnable):
+    """Enumerates saved users on the global thread pool"""
+
+    class Signals(QObject):
+        loaded = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = self.Signals()
+
+    def run(self):
+        from modules.auth import get_all_existing_users
+        try:
+            users = get_all_existing_users()
+        except Exception as e:
+            logging.error(f"Error loading user list: {e}")
+            users = []
+        self.signals.loaded.emit(users)
 
 class LoginDialog(QDialog):
+    # Requests routed to the worker thread (queued connections)
+    _key_login_requested = pyqtSignal(str)
+    _new_user_login_requested = pyqtSignal(str, str)
+    _key_probe_requested = pyqtSignal(str)
+
+    # Key-effect wait: probe every second, give up after this cap
+    KEY_WAIT_CAP_SECS = 30
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle('Login')
         self.setGeometry(100, 100, 500, 400)
         self.selected_user = None
+        # Node information from the successful login; callers read this
+        # off the dialog instance after exec_()
+        self.node_info = None
         
-        # Get the list of existing users
-        self.users = get_all_existing_users()
-        
+        # User list is loaded asynchronously so first paint is bound by
+        # widget construction, not key-store enumeration
+        self.users = []
+        self._users_loading = True
+
+        # Selection updates are coalesced through a zero-interval
+        # single-shot timer so holding an arrow key down doesn't write
+        # to the input/status widgets on every intermediate row
+        self._pending_user = None
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(0)
+        self._select_timer.timeout.connect(self._apply_user_selection)
+
         # Initialize UI
         self.initUI()
-        
-        # Automatically select the first user (if any)
-        if self.users and self.user_list.count() > 0:
-            self.user_list.setCurrentRow(0)
-            self.on_user_selected(self.user_list.item(0))
-        
+
+        # Kick off the background scan; on_users_loaded populates the list
+        loader = _UserListLoader()
+        loader.signals.loaded.connect(self.on_users_loaded)
+        QThreadPool.globalInstance().start(loader)
+
         # Save login information
         self.login_success = False
         self.ssh_key_created = False
 
+        # Worker thread for blocking SSH/key operations; the dialog
+        # only exchanges signals with it
+        self._worker_thread = QThread(self)
+        self.login_worker = LoginWorker()
+        self.login_worker.moveToThread(self._worker_thread)
+        self._key_login_requested.connect(self.login_worker.do_key_login)
+        self._new_user_login_requested.connect(self.login_worker.do_new_user_login)
+        self._key_probe_requested.connect(self.login_worker.do_key_probe)
+        self.login_worker.key_login_done.connect(self.on_key_login_done)
+        self.login_worker.new_user_login_done.connect(self.on_new_user_login_done)
+        self.login_worker.key_probe_done.connect(self.on_key_probe_done)
+        self.login_worker.status_update.connect(self.status_label.setText)
+        self.finished.connect(self._worker_thread.quit)
+        self._worker_thread.start()
+
     def initUI(self):
         """Initialize UI components"""
         main_layout = QVBoxLayout()
@@ -54,7 +178,8 @@ class LoginDialog(QDialog):
         self.user_list = QListWidget()
         self.user_list.setMinimumHeight(150)
         self.populate_user_list()
-        self.user_list.itemClicked.connect(self.on_user_selected)
+        # itemSelectionChanged covers both clicks and keyboard navigation
+        self.user_list.itemSelectionChanged.connect(self.on_selection_changed)
         user_layout.addWidget(self.user_list, 0, 0, 1, 2)
         
         # Delete and login with key buttons
@@ -93,10 +218,10 @@ class LoginDialog(QDialog):
         
         # Add login button
         button_layout2 = QHBoxLayout()
-        new_user_button = QPushButton("Create New User and Login")
-        new_user_button.clicked.connect(self.handle_new_user_login)
-        new_user_button.setMinimumHeight(40)
-        button_layout2.addWidget(new_user_button)
+        self.new_user_button = QPushButton("Create New User and Login")
+        self.new_user_button.clicked.connect(self.handle_new_user_login)
+        self.new_user_button.setMinimumHeight(40)
+        button_layout2.addWidget(self.new_user_button)
         
         main_layout.addLayout(button_layout2)
         
@@ -107,25 +232,61 @@ class LoginDialog(QDialog):
         
         self.setLayout(main_layout)
     
+    @pyqtSlot(list)
+    def on_users_loaded(self, users):
+        """Receive the asynchronously loaded user list"""
+        self._users_loading = False
+        self.users = users
+        self.populate_user_list()
+
+        # Automatically select the first user (if any)
+        if self.users and self.user_list.count() > 0:
+            self.user_list.setCurrentRow(0)
+            self.on_user_selected(self.user_list.item(0))
+
     def populate_user_list(self):
         """Populate user list"""
-        self.user_list.clear()
-        if not self.users:
-            self.user_list.addItem("No saved users found")
-            return
-        
-        for user in self.users:
-            username = user['username']
-            item = QListWidgetItem(username)
-            item.setData(Qt.UserRole, user)
-            self.user_list.addItem(item)
+        # Suppress repaints and per-item signals while the list is
+        # rebuilt so the widget updates once at the end
+        self.user_list.setUpdatesEnabled(False)
+        self.user_list.blockSignals(True)
+        try:
+            self.user_list.clear()
+            if not self.users:
+                self.user_list.addItem("Loading saved users..." if self._users_loading
+                                       else "No saved users found")
+                return
+
+            for user in self.users:
+                username = user['username']
+                item = QListWidgetItem(username)
+                item.setData(Qt.UserRole, user)
+                self.user_list.addItem(item)
+        finally:
+            self.user_list.blockSignals(False)
+            self.user_list.setUpdatesEnabled(True)
     
+    def on_selection_changed(self):
+        """Handler for list selection changes (mouse or keyboard)"""
+        items = self.user_list.selectedItems()
+        if items:
+            self.on_user_selected(items[0])
+
     def on_user_selected(self, item):
-        """Handler function when a user list item is selected"""
+        """Queue a selected user; applied on the next event-loop pass"""
         user_data = item.data(Qt.UserRole)
         if not user_data:
             return
-        
+
+        self._pending_user = user_data
+        self._select_timer.start()
+
+    def _apply_user_selection(self):
+        """Apply the most recent pending selection to the widgets"""
+        user_data = self._pending_user
+        if not user_data:
+            return
+
         self.selected_user = user_data
         self.uc_id_input.setText(user_data['username'])
         self.status_label.setText(f"Selected user: {user_data['username']}")
@@ -146,11 +307,20 @@ class LoginDialog(QDialog):
         )
         
         if confirm == QMessageBox.Yes:
-            success = delete_user_key(self.selected_user['username'])
+            from modules.auth import delete_user_key
+            deleted_username = self.selected_user['username']
+            success = delete_user_key(deleted_username)
             if success:
-                # Update user list
-                self.users = get_all_existing_users()
-                self.populate_user_list()
+                # Remove just the deleted entry instead of rescanning
+                # the key store and rebuilding every list item
+                row = self.user_list.currentRow()
+                if row >= 0:
+                    self.user_list.takeItem(row)
+                self.users = [u for u in self.users
+                              if u['username'] != deleted_username]
+                if not self.users:
+                    self.populate_user_list()
+
                 self.selected_user = None
                 self.uc_id_input.clear()
                 self.status_label.setText("User deleted")
@@ -163,41 +333,53 @@ class LoginDialog(QDialog):
         if not self.selected_user:
             QMessageBox.warning(self, "Warning", "Please select a user first")
             return
-        
+
+        # A login from the last couple of minutes can be replayed from
+        # the on-disk session cache without any network round-trip
+        from modules.auth import load_cached_session
+        cached_node_info = load_cached_session(self.selected_user['username'])
+        if cached_node_info is not None:
+            self.node_info = cached_node_info
+            logging.info(f"User {self.selected_user['username']} logged in from cached session")
+            self.login_success = True
+            self.accept()
+            return
+
         # Check network connection to HPC server
         from modules.auth import check_network_connectivity, HPC_SERVER
         if not check_network_connectivity(HPC_SERVER):
             QMessageBox.critical(self, "Connection Error", "Remote server unreachable, please check your network configuration")
             return
-        
-        try:
-            self.status_label.setText(f"Logging in with key for {self.selected_user['username']}...")
-            QApplication.processEvents()
-            
-            # Attempt to login with key
-            success, username, message = check_and_login_with_key(self.selected_user['username'])
-            
-            if success:
-                # Get node information
-                node_info = get_node_info_via_key(username)
-                
-                # Update global node information
-                global LAST_NODE_INFO
-                LAST_NODE_INFO = node_info
-                
-                # Login successful
-                logging.info(f"User {username} logged in successfully with key")
-                self.login_success = True
-                QMessageBox.information(self, "Success", f"Logged in successfully with key!\n\n{message}")
-                self.accept()
-            else:
-                logging.error(f"Key login failed: {message}")
-                self.status_label.setText("Key login failed")
-                QMessageBox.warning(self, "Login Failed", f"Key login failed: {message}")
-        except Exception as e:
-            logging.error(f"Error during key login: {e}")
-            self.status_label.setText("Login error")
-            QMessageBox.critical(self, "Error", f"Error during login: {str(e)}")
+
+        # Hand the blocking login off to the worker thread; results
+        # come back through on_key_login_done
+        self.status_label.setText(f"Logging in with key for {self.selected_user['username']}...")
+        self.key_login_button.setEnabled(False)
+        self.new_user_button.setEnabled(False)
+        self._key_login_requested.emit(self.selected_user['username'])
+
+    @pyqtSlot(bool, object, object, object)
+    def on_key_login_done(self, success, username, node_info, message):
+        """Handle the worker's key-login result on the UI thread"""
+        self.key_login_button.setEnabled(self.selected_user is not None)
+        self.new_user_button.setEnabled(True)
+
+        if success:
+            self.node_info = node_info
+
+            # Remember this session so an immediate re-login skips SSH
+            from modules.auth import save_cached_session
+            save_cached_session(username, node_info)
+
+            # Login successful
+            logging.info(f"User {username} logged in successfully with key")
+            self.login_success = True
+            QMessageBox.information(self, "Success", f"Logged in successfully with key!\n\n{message}")
+            self.accept()
+        else:
+            logging.error(f"Key login failed: {message}")
+            self.status_label.setText("Key login failed")
+            QMessageBox.warning(self, "Login Failed", f"Key login failed: {message}")
     
     def handle_new_user_login(self):
         """Handle new user login"""
@@ -214,67 +396,93 @@ class LoginDialog(QDialog):
             QMessageBox.critical(self, "Connection Error", "Remote server unreachable, please check your network configuration")
             return
         
-        try:
-            # Show logging in message
-            self.status_label.setText("Creating new user and logging in, please wait...")
-            QApplication.processEvents()
-            
-            # Use generate_and_upload_ssh_key function to create new user and login
-            result = generate_and_upload_ssh_key(
-                username=uc_id,
-                password=password,
-                host=HPC_SERVER,
-                force=True
-            )
-            
-            if result:
-                # Login successful, get node information
-                node_info = get_node_info_via_key(uc_id)
-            
-                # Update global node information
-                global LAST_NODE_INFO
-                LAST_NODE_INFO = node_info
-                
-                # Update user list
-                self.users = get_all_existing_users()
-                
-                # Login successful
-                logging.info(f"New user created and logged in successfully: {uc_id}")
-                self.login_success = True
-                self.ssh_key_created = True
-                
-                # Create progress dialog, waiting for key to take effect
-                progress = QProgressDialog("SSH key created, waiting to take effect...", "Cancel", 0, 100, self)
-                progress.setWindowTitle("Key Effect")
-                progress.setMinimumDuration(0)
-                progress.setAutoClose(True)
-                progress.setValue(0)
-                progress.show()
-                
-                # Set progress bar update
-                self.wait_timer = QTimer(self)
-                self.wait_step = 0
-                
-                def update_progress():
-                    self.wait_step += 5
-                    progress.setValue(self.wait_step)
-                    
-                    if self.wait_step >= 100:
-                        self.wait_timer.stop()
-                        progress.close()
-                        # Show success message
-                        message = f"Login successful!\n\nSSH key created and effective.\nNext login will automatically use the key.\n\nNode information:\n{node_info if node_info else 'No node information'}"
-                        QMessageBox.information(self, "Success", message)
-                        self.accept()
-                
-                self.wait_timer.timeout.connect(update_progress)
-                self.wait_timer.start(1000)  # Update every second, total 20 seconds
-            else:
-                # Login failed
-                logging.error("Login failed")
-                self.status_label.setText("Login failed, please check your credentials")
-                QMessageBox.warning(self, "Login Failed", "Login failed, please check your credentials and try again.")
-        except Exception as e:
-            logging.error(f"Error during login: {e}")
-            self.status_label.setText("Login error")
-            QMessageBox.critical(self, "Error", f"Error during login: {str(e)}") 
\ No newline at end of file
+        # Hand the key generation/upload off to the worker thread;
+        # results come back through on_new_user_login_done
+        self.status_label.setText("Creating new user and logging in, please wait...")
+        self.new_user_button.setEnabled(False)
+        self.key_login_button.setEnabled(False)
+        self._new_user_login_requested.emit(uc_id, password)
+
+    @pyqtSlot(bool, object)
+    def on_new_user_login_done(self, success, node_info):
+        """Handle the worker's new-user-login result on the UI thread"""
+        uc_id = self.uc_id_input.text()
+        self.new_user_button.setEnabled(True)
+        self.key_login_button.setEnabled(self.selected_user is not None)
+
+        if success:
+            self.node_info = node_info
+
+            # Update user list
+            from modules.auth import get_all_existing_users
+            self.users = get_all_existing_users()
+
+            # Login successful
+            logging.info(f"New user created and logged in successfully: {uc_id}")
+            self.login_success = True
+            self.ssh_key_created = True
+
+            # Wait for the key to take effect by probing it, instead of
+            # sitting out a fixed 20 seconds
+            self._start_key_wait(uc_id, node_info)
+        else:
+            # Login failed
+            logging.error("Login failed")
+            self.status_label.setText("Login failed, please check your credentials")
+            QMessageBox.warning(self, "Login Failed", "Login failed, please check your credentials and try again.")
+
+    def _start_key_wait(self, uc_id, node_info):
+        """Show a progress dialog and probe until the uploaded key works"""
+        self._key_wait_progress = QProgressDialog(
+            "SSH key created, waiting to take effect...", "Cancel", 0, 100, self)
+        self._key_wait_progress.setWindowTitle("Key Effect")
+        self._key_wait_progress.setMinimumDuration(0)
+        self._key_wait_progress.setAutoClose(True)
+        self._key_wait_progress.setValue(0)
+        self._key_wait_progress.show()
+
+        self._probe_user = uc_id
+        self._probe_node_info = node_info
+        self._probe_in_flight = False
+        self._probe_start = time.monotonic()
+
+        self.wait_timer = QTimer(self)
+        self.wait_timer.timeout.connect(self._poll_key_effect)
+        self.wait_timer.start(1000)
+        self._poll_key_effect()
+
+    def _poll_key_effect(self):
+        """Timer tick: advance progress and kick off the next probe"""
+        elapsed = time.monotonic() - self._probe_start
+        self._key_wait_progress.setValue(
+            min(int(elapsed / self.KEY_WAIT_CAP_SECS * 100), 99))
+
+        # Hard cap or user cancel: proceed with what we have
+        if self._key_wait_progress.wasCanceled() or elapsed > self.KEY_WAIT_CAP_SECS:
+            self._finish_key_wait(self._probe_node_info)
+            return
+
+        # One probe at a time; a slow probe just skips a tick
+        if not self._probe_in_flight:
+            self._probe_in_flight = True
+            self._key_probe_requested.emit(self._probe_user)
+
+    @pyqtSlot(bool, object)
+    def on_key_probe_done(self, success, node_info):
+        """Handle a key-effect probe result on the UI thread"""
+        self._probe_in_flight = False
+        if not hasattr(self, 'wait_timer') or not self.wait_timer.isActive():
+            return
+        if success:
+            self._finish_key_wait(node_info or self._probe_node_info)
+
+    def _finish_key_wait(self, node_info):
+        """Close the wait dialog and complete the new-user login"""
+        self.wait_timer.stop()
+        self._key_wait_progress.close()
+
+        self.node_info = node_info
+
+        message = f"Login successful!\n\nSSH key created and effective.\nNext login will automatically use the key.\n\nNode information:\n{node_info if node_info else 'No node information'}"
+        QMessageBox.information(self, "Success", message)
+        self.accept()
\ No newline at end of file
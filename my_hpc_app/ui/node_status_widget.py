@@ -1,62 +1,201 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                           QTableWidget, QTableWidgetItem, QTabWidget,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                           QTableView, QAbstractItemView, QTabWidget,
                            QHeaderView, QStyle, QProgressBar, QSplitter, QFrame, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QDateTime, QThread, pyqtSignal
+from PyQt5.QtCore import (Qt, QTimer, pyqtSlot, QDateTime, QObject, QRunnable,
+                          QThreadPool, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel, pyqtSignal)
 from PyQt5.QtGui import QFont, QColor, QIcon, QBrush
 import logging
+import threading
 import time
 from modules.node_status import NodeStatusManager
-from modules.auth import HPC_SERVER, get_all_existing_users
+from modules.auth import HPC_SERVER, get_user_record
 
 # Configure logging
 logger = logging.getLogger('NodeStatusWidget')
 
-class RefreshWorker(QThread):
-    """Thread for refreshing data in the background"""
-    
-    # Define signals
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-    nodes_data = pyqtSignal(list)
-    
-    def __init__(self, node_manager):
-        """Initialize refresh thread"""
+# Shared foreground brushes; built once instead of per cell per refresh
+_BRUSHES = {
+    'red': QBrush(QColor(255, 0, 0)),
+    'orange': QBrush(QColor(255, 165, 0)),
+    'green': QBrush(QColor(0, 128, 0)),
+    'blue': QBrush(QColor(0, 0, 255)),
+}
+
+
+def _usage_color_key(usage):
+    """Color key based on usage rate"""
+    if usage > 80:
+        return 'red'
+    if usage > 60:
+        return 'orange'
+    return 'green'
+
+
+# Color key per NodeState value: IDLE, PARTIAL, FULL, FAULT
+_STATE_COLOR_KEYS = ('green', 'blue', 'orange', 'red')
+
+
+def _row_specs(nodes):
+    """Build (text, color key, sort key) cell specs per node
+
+    The sort key is the numeric usage behind the "X/Y" display string,
+    or None for plain text columns.
+    """
+    specs = []
+    for node in nodes:
+        if node.has_gpu:
+            gpu_type_cell = (node.gpu_type, None, None)
+            gpu_cell = (f"{node.used_gpus}/{node.gpu_count}",
+                        _usage_color_key(node.gpu_usage),
+                        node.gpu_usage)
+        else:
+            gpu_type_cell = ("N/A", None, None)
+            gpu_cell = ("N/A", None, -1.0)
+        specs.append((
+            (node.name, _STATE_COLOR_KEYS[node.state_code], None),
+            (f"{node.alloc_cpus}/{node.total_cpus}",
+             _usage_color_key(node.cpu_usage),
+             node.cpu_usage),
+            (f"{node.alloc_mem}/{node.memory}",
+             _usage_color_key(node.memory_usage),
+             node.memory_usage),
+            gpu_type_cell,
+            gpu_cell,
+        ))
+    return specs
+
+
+def _prepare_payload(nodes):
+    """Prepack a refresh result into what the UI thread consumes
+
+    Runs on the worker thread: one pass accumulates the stats and the
+    GPU subset, then the cell texts and color/sort keys are formatted
+    there too, so the UI thread only writes strings into items instead
+    of marshaling and re-walking a list of dicts.
+    """
+    total_cpus = used_cpus = total_gpus = used_gpus = 0
+    gpu_nodes = []
+    for n in nodes:
+        total_cpus += n.total_cpus
+        used_cpus += n.alloc_cpus
+        if n.has_gpu:
+            gpu_nodes.append(n)
+            total_gpus += n.gpu_count
+            used_gpus += n.used_gpus
+    # NodeRow tuples hash directly; no need to project out fields
+    nodes_hash = hash(tuple(nodes))
+    stats = (len(nodes), used_cpus, total_cpus, used_gpus, total_gpus)
+    return (nodes_hash, stats, _row_specs(nodes), _row_specs(gpu_nodes))
+
+class NodeTableModel(QAbstractTableModel):
+    """Table model over the worker-prepared cell specs
+
+    A QTableWidget allocates an item per cell and emits change signals
+    per setItem; the model serves DisplayRole/ForegroundRole straight
+    from the prepacked (text, color key, sort key) specs and a refresh
+    costs one reset, or per-row dataChanged when only values moved.
+    Sorting goes through RawSortRole so the "X/Y" usage columns compare
+    numerically.
+    """
+
+    HEADERS = ["Node Name", "CPU Usage/Total", "Memory Usage",
+               "GPU Type", "GPU Usage/Total"]
+
+    RawSortRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, color_key, sort_key = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == self.RawSortRole:
+            return sort_key if sort_key is not None else text
+        if role == Qt.ForegroundRole and color_key is not None:
+            return _BRUSHES[color_key]
+        return None
+
+    def set_rows(self, rows):
+        """Swap in a new spec list
+
+        When the row count is unchanged (the common refresh), rows are
+        updated in place with one dataChanged per changed row; shape
+        changes fall back to a full model reset.
+        """
+        if len(rows) == len(self._rows):
+            last_col = len(self.HEADERS) - 1
+            for row, new_row in enumerate(rows):
+                if new_row != self._rows[row]:
+                    self._rows[row] = new_row
+                    self.dataChanged.emit(self.index(row, 0),
+                                          self.index(row, last_col))
+            return
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+
+class RefreshRunnable(QRunnable):
+    """Fetches node data on a pooled worker thread
+
+    A fresh QThread per refresh costs an OS thread spawn and risks
+    terminate() races on rapid refreshes; a runnable on a persistent
+    single-thread pool just reuses the same worker thread.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal()
+        error = pyqtSignal(str)
+        nodes_payload = pyqtSignal(tuple)
+
+    def __init__(self, node_manager, cancel_event=None):
         super().__init__()
         self.node_manager = node_manager
-        self._stopped = False
-    
+        self.cancel_event = cancel_event
+        self.signals = self.Signals()
+
     def run(self):
-        """Thread execution function"""
         try:
-            if self._stopped:
-                return
-                
             # Get node data
-            nodes = self.node_manager.get_all_nodes()
+            nodes = self.node_manager.get_all_nodes(cancel_event=self.cancel_event)
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                return
             if nodes:
-                self.nodes_data.emit(nodes)
+                self.signals.nodes_payload.emit(_prepare_payload(nodes))
             else:
-                self.error.emit("Failed to retrieve node data")
+                self.signals.error.emit("Failed to retrieve node data")
         except Exception as e:
             logger.error(f"Failed to refresh data: {str(e)}")
-            self.error.emit(f"Failed to refresh data: {str(e)}")
+            self.signals.error.emit(f"Failed to refresh data: {str(e)}")
         finally:
-            self.finished.emit()
-    
-    def stop(self):
-        """Stop thread"""
-        self._stopped = True
-        if self.isRunning():
-            self.wait(1000)
-            if self.isRunning():
-                self.terminate()
+            self.signals.finished.emit()
 
 class NodeStatusWidget(QWidget):
     """Node status component, displays HPC cluster node information and availability"""
-    
+
+    # Delay between the end of one auto-refresh and the start of the
+    # next; matches NodeStatusManager's server-side cache window
+    AUTO_REFRESH_INTERVAL_MS = 60_000
+
     def __init__(self, parent=None, username=None):
         super().__init__(parent)
         
@@ -64,26 +203,53 @@ class NodeStatusWidget(QWidget):
         self.username = username
         self.node_manager = None
         
-        # Last refresh time
-        self.last_refresh_time = None
-        
-        # Node data
-        self.nodes_data = []
-        
-        # Refresh worker thread
-        self.refresh_worker = None
-        
+        # Last refresh time: monotonic epoch for elapsed math, plus the
+        # wall-clock string formatted once per refresh
+        self._last_refresh_monotonic = None
+        self._last_refresh_str = None
+
+        # Last color applied per label; setStyleSheet reparses the
+        # style even for an identical string, so skip no-op changes
+        self._label_colors = {}
+        
+        # Prepacked cell specs from the last refresh, plus dirty flags
+        # so the hidden tab is only rendered when it becomes visible
+        self._all_specs = []
+        self._gpu_specs = []
+        self._dirty_all = False
+        self._dirty_gpu = False
+        # Signature of the last rendered payload; identical fetches
+        # skip the table/stat updates entirely
+        self._last_nodes_hash = None
+        
+        # Single-thread pool for refresh work; one in-flight fetch at a
+        # time, overlapping requests are simply dropped
+        self.refresh_pool = QThreadPool(self)
+        self.refresh_pool.setMaxThreadCount(1)
+        self._refresh_in_flight = False
+        # Cooperative cancel token checked by the fetch path on close
+        self._cancel_event = threading.Event()
+
         # Initialize node manager
         self.init_node_manager()
         
         # Initialize UI
         self.init_ui()
         
-        # Timer to refresh time display
+        # Timer to refresh the time display; single-shot, re-armed to
+        # fire exactly at the next color threshold instead of waking
+        # the event loop every 10 seconds
         self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
         self.refresh_timer.timeout.connect(self.update_refresh_time)
-        self.refresh_timer.start(10000)  # Every 10 seconds to update time display
-        
+
+        # Auto-refresh is single-shot and re-armed only after a fetch
+        # completes, so slow SSH rounds can never queue up behind the
+        # timer
+        self.auto_refresh_timer = QTimer(self)
+        self.auto_refresh_timer.setSingleShot(True)
+        self.auto_refresh_timer.timeout.connect(self.refresh_data)
+
         # Load data
         self.refresh_data()
     
@@ -92,15 +258,10 @@ class NodeStatusWidget(QWidget):
         if not self.username:
             return
         
-        # Get SSH key path
-        users = get_all_existing_users()
-        key_path = None
-        
-        for user in users:
-            if user['username'] == self.username:
-                key_path = user['key_path']
-                break
-        
+        # Get SSH key path from the cached by-name user index
+        user = get_user_record(self.username)
+        key_path = user['key_path'] if user else None
+
         if not key_path:
             return
         
@@ -111,8 +272,8 @@ class NodeStatusWidget(QWidget):
             key_path=key_path
         )
         
-        # Connect signals
-        self.node_manager.nodes_updated.connect(self.update_nodes_data)
+        # Connect signals; node data itself arrives prepacked through
+        # the refresh runnable, not the manager's raw nodes_updated
         self.node_manager.error_occurred.connect(self.show_error)
     
     def init_ui(self):
@@ -130,7 +291,7 @@ class NodeStatusWidget(QWidget):
         
         # Refresh status indicator
         self.refresh_indicator = QLabel("Ready")
-        self.refresh_indicator.setStyleSheet("color: green;")
+        self._set_label_color(self.refresh_indicator, "green")
         control_layout.addWidget(self.refresh_indicator)
         
         control_layout.addStretch()
@@ -149,20 +310,20 @@ class NodeStatusWidget(QWidget):
         main_layout.addLayout(control_layout)
         
         # Create tabs
-        tabs = QTabWidget()
+        self.tabs = tabs = QTabWidget()
         
         # GPU nodes tab (create GPU nodes tab first, place it in the first position)
         gpu_tab = QWidget()
         gpu_layout = QVBoxLayout(gpu_tab)
         
-        self.gpu_nodes_table = QTableWidget()
-        self.gpu_nodes_table.setColumnCount(5)
-        self.gpu_nodes_table.setHorizontalHeaderLabels([
-            "Node Name", "CPU Usage/Total", "Memory Usage", 
-            "GPU Type", "GPU Usage/Total"
-        ])
+        self.gpu_nodes_model = NodeTableModel(self)
+        gpu_proxy = QSortFilterProxyModel(self)
+        gpu_proxy.setSourceModel(self.gpu_nodes_model)
+        gpu_proxy.setSortRole(NodeTableModel.RawSortRole)
+        self.gpu_nodes_table = QTableView()
+        self.gpu_nodes_table.setModel(gpu_proxy)
         self.gpu_nodes_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.gpu_nodes_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.gpu_nodes_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.gpu_nodes_table.setSortingEnabled(True)
         
         gpu_layout.addWidget(self.gpu_nodes_table)
@@ -171,14 +332,14 @@ class NodeStatusWidget(QWidget):
         all_nodes_tab = QWidget()
         all_layout = QVBoxLayout(all_nodes_tab)
         
-        self.all_nodes_table = QTableWidget()
-        self.all_nodes_table.setColumnCount(5)
-        self.all_nodes_table.setHorizontalHeaderLabels([
-            "Node Name", "CPU Usage/Total", "Memory Usage", 
-            "GPU Type", "GPU Usage/Total"
-        ])
+        self.all_nodes_model = NodeTableModel(self)
+        all_proxy = QSortFilterProxyModel(self)
+        all_proxy.setSourceModel(self.all_nodes_model)
+        all_proxy.setSortRole(NodeTableModel.RawSortRole)
+        self.all_nodes_table = QTableView()
+        self.all_nodes_table.setModel(all_proxy)
         self.all_nodes_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.all_nodes_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.all_nodes_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.all_nodes_table.setSortingEnabled(True)
         
         all_layout.addWidget(self.all_nodes_table)
@@ -186,6 +347,9 @@ class NodeStatusWidget(QWidget):
         # Add tabs, GPU nodes displayed first
         tabs.addTab(gpu_tab, "GPU Nodes")
         tabs.addTab(all_nodes_tab, "All Nodes")
+
+        # A tab switched to with a pending update gets rendered then
+        tabs.currentChanged.connect(self.on_tab_changed)
         
         # Add tabs to main layout
         main_layout.addWidget(tabs)
@@ -201,21 +365,29 @@ class NodeStatusWidget(QWidget):
     
     def update_refresh_time(self):
         """Update refresh time display"""
-        if self.last_refresh_time:
-            time_str = self.last_refresh_time.toString("yyyy-MM-dd hh:mm:ss")
-            self.time_label.setText(f"Last refresh: {time_str}")
-            
-            # Calculate time since last refresh
-            now = QDateTime.currentDateTime()
-            secs = self.last_refresh_time.secsTo(now)
-            
-            # Set color based on time
+        if self._last_refresh_monotonic is not None:
+            self.time_label.setText(f"Last refresh: {self._last_refresh_str}")
+
+            # Elapsed on the monotonic clock; no QDateTime (and its
+            # timezone machinery) per tick
+            secs = int(time.monotonic() - self._last_refresh_monotonic)
+
+            # Set color based on time, then sleep until the next color
+            # threshold crossing
             if secs < 60:  # Within 1 minute
-                self.time_label.setStyleSheet("color: green;")
+                self._set_label_color(self.time_label, "green")
+                self.refresh_timer.start((60 - secs) * 1000)
             elif secs < 300:  # Within 5 minutes
-                self.time_label.setStyleSheet("color: orange;")
-            else:  # More than 5 minutes
-                self.time_label.setStyleSheet("color: red;")
+                self._set_label_color(self.time_label, "orange")
+                self.refresh_timer.start((300 - secs) * 1000)
+            else:  # More than 5 minutes; final bucket, nothing to schedule
+                self._set_label_color(self.time_label, "red")
+
+    def _set_label_color(self, label, color):
+        """Apply a color stylesheet only on an actual color change"""
+        if self._label_colors.get(label) != color:
+            label.setStyleSheet(f"color: {color};")
+            self._label_colors[label] = color
     
     @pyqtSlot()
     def refresh_data(self):
@@ -224,188 +396,98 @@ class NodeStatusWidget(QWidget):
             self.show_error("Node manager not set, unable to retrieve data")
             return
         
+        # Drop the request if a fetch is already running
+        if self._refresh_in_flight:
+            return
+        self._refresh_in_flight = True
+
         # Update UI status
         self.refresh_btn.setEnabled(False)
         self.refresh_indicator.setText("Refreshing...")
-        self.refresh_indicator.setStyleSheet("color: orange;")
-        
-        # Safely stop existing thread
-        if self.refresh_worker and self.refresh_worker.isRunning():
-            self.refresh_worker.stop()
-        
-        # Create new refresh thread
-        self.refresh_worker = RefreshWorker(self.node_manager)
-        
-        # Connect signals
-        self.refresh_worker.finished.connect(self.on_refresh_finished)
-        self.refresh_worker.error.connect(self.show_error)
-        self.refresh_worker.nodes_data.connect(self.update_nodes_data)
-        
-        # Start thread
-        self.refresh_worker.start()
-        
-        # Update refresh time
-        self.last_refresh_time = QDateTime.currentDateTime()
+        self._set_label_color(self.refresh_indicator, "orange")
+
+        # Submit the fetch to the persistent worker pool
+        runnable = RefreshRunnable(self.node_manager, self._cancel_event)
+        runnable.signals.finished.connect(self.on_refresh_finished)
+        runnable.signals.error.connect(self.show_error)
+        runnable.signals.nodes_payload.connect(self.update_nodes_data)
+        self.refresh_pool.start(runnable)
+
+        # Update refresh time; the display string is formatted once here
+        self._last_refresh_monotonic = time.monotonic()
+        self._last_refresh_str = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
         self.update_refresh_time()
     
     def on_refresh_finished(self):
         """Callback function when refresh is finished"""
+        self._refresh_in_flight = False
+
         # Update UI status
         self.refresh_btn.setEnabled(True)
         self.refresh_indicator.setText("Ready")
-        self.refresh_indicator.setStyleSheet("color: green;")
+        self._set_label_color(self.refresh_indicator, "green")
+
+        # Schedule the next poll relative to this completion
+        self.auto_refresh_timer.start(self.AUTO_REFRESH_INTERVAL_MS)
     
-    @pyqtSlot(list)
-    def update_nodes_data(self, nodes_data):
-        """Update node data"""
-        if not nodes_data:
+    @pyqtSlot(tuple)
+    def update_nodes_data(self, payload):
+        """Render a prepacked refresh payload from the worker"""
+        nodes_hash, stats, all_specs, gpu_specs = payload
+
+        # Most polls return the exact same cluster state; don't redo
+        # the stats and table passes for a no-op refresh
+        if nodes_hash == self._last_nodes_hash:
             return
-        
-        self.nodes_data = nodes_data
-        
+        self._last_nodes_hash = nodes_hash
+
+        self._all_specs = all_specs
+        self._gpu_specs = gpu_specs
+        self._dirty_all = True
+        self._dirty_gpu = True
+
         # Update statistics
-        self.update_stats()
-        
-        # Update all nodes table
-        self.update_all_nodes_table()
-        
-        # Update GPU nodes table
-        self.update_gpu_nodes_table()
-    
-    def update_stats(self):
+        self.update_stats(*stats)
+
+        # Only render the visible tab; the other is flushed on switch
+        self._flush_visible_tab()
+
+    def _flush_visible_tab(self):
+        """Render any pending update for the currently visible tab"""
+        index = self.tabs.currentIndex()
+        if index == 0 and self._dirty_gpu:
+            self.update_gpu_nodes_table(self._gpu_specs)
+            self._dirty_gpu = False
+        elif index == 1 and self._dirty_all:
+            self.update_all_nodes_table(self._all_specs)
+            self._dirty_all = False
+
+    def on_tab_changed(self, index):
+        """Flush the newly shown tab if a refresh landed while hidden"""
+        self._flush_visible_tab()
+
+    def update_stats(self, total_nodes, used_cpus, total_cpus, used_gpus, total_gpus):
         """Update statistics"""
-        if not self.nodes_data:
-            return
-        
-        # Calculate basic statistics
-        total_nodes = len(self.nodes_data)
-        
-        total_cpus = sum(n['total_cpus'] for n in self.nodes_data)
-        used_cpus = sum(n['alloc_cpus'] for n in self.nodes_data)
-        
-        gpu_nodes = [n for n in self.nodes_data if n['has_gpu']]
-        total_gpus = sum(n['gpu_count'] for n in gpu_nodes)
-        used_gpus = sum(n['used_gpus'] for n in gpu_nodes)
-        
-        # Update label
         stats_text = f"Total Nodes: {total_nodes} | CPU Usage: {used_cpus}/{total_cpus} | "
         stats_text += f"GPU Usage: {used_gpus}/{total_gpus}"
         self.stats_label.setText(stats_text)
     
-    def update_all_nodes_table(self):
+    def update_all_nodes_table(self, specs=None):
         """Update all nodes table"""
-        self.all_nodes_table.setSortingEnabled(False)
-        self.all_nodes_table.setRowCount(0)
-        
-        if not self.nodes_data:
-            return
-        
-        # Add a row for each node
-        for row, node in enumerate(self.nodes_data):
-            self.all_nodes_table.insertRow(row)
-            
-            # Node name
-            name_item = QTableWidgetItem(node['name'])
-            # Set color of node name based on state
-            self.set_color_by_state(name_item, node['state'])
-            self.all_nodes_table.setItem(row, 0, name_item)
-            
-            # CPU Usage/Total
-            cpu_text = f"{node['alloc_cpus']}/{node['total_cpus']}"
-            cpu_item = QTableWidgetItem(cpu_text)
-            self.set_color_by_usage(cpu_item, node['cpu_usage'])
-            self.all_nodes_table.setItem(row, 1, cpu_item)
-            
-            # Memory Usage
-            mem_text = f"{node['alloc_mem']}/{node['memory']}"
-            mem_item = QTableWidgetItem(mem_text)
-            self.set_color_by_usage(mem_item, node['memory_usage'])
-            self.all_nodes_table.setItem(row, 2, mem_item)
-            
-            # GPU Type
-            gpu_type = node['gpu_type'] if node['has_gpu'] else "N/A"
-            self.all_nodes_table.setItem(row, 3, QTableWidgetItem(gpu_type))
-            
-            # GPU Usage/Total
-            if node['has_gpu']:
-                gpu_text = f"{node['used_gpus']}/{node['gpu_count']}"
-                gpu_item = QTableWidgetItem(gpu_text)
-                self.set_color_by_usage(gpu_item, node['gpu_usage'])
-            else:
-                gpu_text = "N/A"
-                gpu_item = QTableWidgetItem(gpu_text)
-            self.all_nodes_table.setItem(row, 4, gpu_item)
-        
-        self.all_nodes_table.setSortingEnabled(True)
-    
-    def update_gpu_nodes_table(self):
+        if specs is None:
+            specs = self._all_specs
+        self.all_nodes_model.set_rows(specs)
+
+    def update_gpu_nodes_table(self, specs=None):
         """Update GPU nodes table"""
-        self.gpu_nodes_table.setSortingEnabled(False)
-        self.gpu_nodes_table.setRowCount(0)
-        
-        if not self.nodes_data:
-            return
-        
-        # Filter GPU nodes
-        gpu_nodes = [n for n in self.nodes_data if n['has_gpu']]
-        
-        # Add a row for each GPU node
-        for row, node in enumerate(gpu_nodes):
-            self.gpu_nodes_table.insertRow(row)
-            
-            # Node name
-            name_item = QTableWidgetItem(node['name'])
-            # Set color of node name based on state
-            self.set_color_by_state(name_item, node['state'])
-            self.gpu_nodes_table.setItem(row, 0, name_item)
-            
-            # CPU Usage/Total
-            cpu_text = f"{node['alloc_cpus']}/{node['total_cpus']}"
-            cpu_item = QTableWidgetItem(cpu_text)
-            self.set_color_by_usage(cpu_item, node['cpu_usage'])
-            self.gpu_nodes_table.setItem(row, 1, cpu_item)
-            
-            # Memory Usage
-            mem_text = f"{node['alloc_mem']}/{node['memory']}"
-            mem_item = QTableWidgetItem(mem_text)
-            self.set_color_by_usage(mem_item, node['memory_usage'])
-            self.gpu_nodes_table.setItem(row, 2, mem_item)
-            
-            # GPU Type
-            self.gpu_nodes_table.setItem(row, 3, QTableWidgetItem(node['gpu_type']))
-            
-            # GPU Usage/Total
-            gpu_text = f"{node['used_gpus']}/{node['gpu_count']}"
-            gpu_item = QTableWidgetItem(gpu_text)
-            self.set_color_by_usage(gpu_item, node['gpu_usage'])
-            self.gpu_nodes_table.setItem(row, 4, gpu_item)
-        
-        self.gpu_nodes_table.setSortingEnabled(True)
-    
-    def set_color_by_usage(self, item, usage):
-        """Set color based on usage rate"""
-        if usage > 80:
-            item.setForeground(QBrush(QColor(255, 0, 0)))  # Red
-        elif usage > 60:
-            item.setForeground(QBrush(QColor(255, 165, 0)))  # Orange
-        else:
-            item.setForeground(QBrush(QColor(0, 128, 0)))  # Green
-    
-    def set_color_by_state(self, item, state):
-        """Set color based on state"""
-        if state == "故障":
-            item.setForeground(QBrush(QColor(255, 0, 0)))  # Red
-        elif state == "满载":
-            item.setForeground(QBrush(QColor(255, 165, 0)))  # Orange
-        elif state == "部分使用":
-            item.setForeground(QBrush(QColor(0, 0, 255)))  # Blue
-        else:  # Idle
-            item.setForeground(QBrush(QColor(0, 128, 0)))  # Green
+        if specs is None:
+            specs = self._gpu_specs
+        self.gpu_nodes_model.set_rows(specs)
     
     def show_error(self, error_msg):
         """Display error message"""
         self.refresh_indicator.setText(f"Error: {error_msg}")
-        self.refresh_indicator.setStyleSheet("color: red;")
+        self._set_label_color(self.refresh_indicator, "red")
         logger.error(error_msg)
         
         # Enable refresh button
@@ -416,9 +498,12 @@ class NodeStatusWidget(QWidget):
         # Stop all timers
         if hasattr(self, 'refresh_timer') and self.refresh_timer:
             self.refresh_timer.stop()
-        
-        # Stop refresh thread
-        if self.refresh_worker and self.refresh_worker.isRunning():
-            self.refresh_worker.stop()
-        
-        super().closeEvent(event) 
\ No newline at end of file
+        if hasattr(self, 'auto_refresh_timer') and self.auto_refresh_timer:
+            self.auto_refresh_timer.stop()
+
+        # Ask any in-flight fetch to bail out, then let it drain on the
+        # pool's worker thread
+        self._cancel_event.set()
+        self.refresh_pool.waitForDone(1000)
+
+        super().closeEvent(event)
\ No newline at end of file